@@ -1,67 +1,237 @@
 import json
+import mmap
+import os
 import time
 import threading
-import secrets
 import hmac
-import hashlib
 from contextlib import contextmanager
 from pathlib import Path
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib encoder is used otherwise
+    orjson = None
 
 SECRET_KEY = b'shared-bank-secret'
-BANK_FILE = Path(__file__).with_name('bank.json')
+BANK_FILE = Path(__file__).with_name('bank.log')
+COMPACT_THRESHOLD = 10_000  # rewrite the log once this many of its lines are superseded
+_LOCK_SHARDS = 16
+# _lock guards the log file and the replayed state; the sharded locks serialize
+# the check-then-write steps for a single code so unrelated codes never wait on
+# each other while one of them is being validated.
 _lock = threading.Lock()
+_locks = tuple(threading.Lock() for _ in range(_LOCK_SHARDS))
+# Replayed view of BANK_FILE; ``offset`` marks how far it has been verified.
+# ``pending`` holds the signed create line of every unclaimed transfer.
+# ``stamp`` is the file identity seen at the last sync; while the file still
+# matches it nothing new can have been written, so _load has nothing to do.
+_state: dict = {'transfers': {}, 'pending': {}, 'offset': 0, 'lines': 0, 'tail': b'', 'stamp': None}
 
-def _sign(transfers: dict) -> str:
-    data = json.dumps({'transfers': transfers}, sort_keys=True).encode()
-    return hmac.new(SECRET_KEY, data, hashlib.sha256).hexdigest()
+def _sign(body: bytes) -> str:
+    return hmac.digest(SECRET_KEY, body, 'sha256').hex()
 
-def _save(data: dict) -> None:
-    transfers = data.get('transfers', {})
-    payload = {'transfers': transfers, 'signature': _sign(transfers)}
-    with open(BANK_FILE, 'w', encoding='utf-8') as f:
-        json.dump(payload, f, indent=2)
+_SIG_LEN = 64  # hex digits in a sha256 signature
+
+def _dumps(record: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(record, sort_keys=True, separators=(',', ':')).encode()
+
+def _loads(body):
+    if orjson is not None:
+        return orjson.loads(body)  # takes the memoryview without copying
+    return json.loads(bytes(body))
+
+def _encode(record: dict) -> bytes:
+    """Serialize one event as a signed log line: ``<hmac hex>\\t<json>\\n``."""
+    body = _dumps(record)
+    return _sign(body).encode() + b'\t' + body + b'\n'
+
+def _verify(line: bytes):
+    """Return the record a signed log line carries, or None if its signature does not match."""
+    view = memoryview(line)
+    tab = line.find(b'\t')
+    if tab < 0 or not hmac.compare_digest(_sign(view[tab + 1:-1]).encode(), view[:tab]):
+        return None
+    return _loads(view[tab + 1:-1])
+
+def _apply(transfers: dict, record: dict) -> None:
+    event = record.get('event')
+    if event == 'create':
+        t = record['transfer']
+        transfers[t['code']] = t
+    elif event == 'claim':
+        t = transfers.get(record['code'])
+        if t:
+            t['claimed'] = True
+
+def _accept(line: bytes, record: dict) -> None:
+    """Fold one verified log line into the cached state."""
+    _apply(_state['transfers'], record)
+    if record.get('event') == 'create':
+        _state['pending'][record['transfer']['code']] = line
+    else:
+        _state['pending'].pop(record.get('code'), None)
+    _state['offset'] += len(line)
+    _state['lines'] += 1
+    _state['tail'] = line
+
+def _stamp(st: os.stat_result) -> tuple:
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+def _current_stamp():
+    try:
+        return _stamp(BANK_FILE.stat())
+    except FileNotFoundError:
+        return None
+
+def _lock_for(code: str) -> threading.Lock:
+    return _locks[hash(code) % _LOCK_SHARDS]
+
+def _append(record: dict) -> None:
+    """Write one event to the log and apply it to the in-memory state."""
+    line = _encode(record)
+    with _lock:
+        with open(BANK_FILE, 'ab') as f:
+            f.write(line)
+            # We signed these exact bytes, so there is no need to read them
+            # back -- unless another process appended first and left a gap.
+            contiguous = f.tell() == _state['offset'] + len(line)
+            stamp = _stamp(os.fstat(f.fileno()))
+        if contiguous:
+            _accept(line, record)
+            _state['stamp'] = stamp
+        else:
+            _load()
+
+def _reset_state() -> None:
+    _state.update(transfers={}, pending={}, offset=0, lines=0, tail=b'', stamp=None)
+
+def compact() -> None:
+    """Rewrite the log as one create record per transfer; the caller holds _lock."""
+    tmp = BANK_FILE.with_suffix('.tmp')
+    while True:
+        # Catch up on lines other processes appended since our last sync, or
+        # the rewrite would drop them.
+        _load()
+        pending = _state['pending']
+        # Unclaimed transfers keep their original signed line; only claimed ones
+        # need a fresh create record carrying claimed=True.
+        lines = [
+            pending.get(code) or _encode({'event': 'create', 'transfer': t})
+            for code, t in _state['transfers'].items()
+        ]
+        # Write the new log beside the old one and swap it in, so a crash while
+        # compacting leaves either the old or the new log, never a torn one.
+        with open(tmp, 'wb') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        # Something was appended while we wrote the copy; start over rather
+        # than replace the log with one that is missing it.
+        if _current_stamp() == _state['stamp']:
+            break
+    os.replace(tmp, BANK_FILE)
+    _state.update(
+        offset=sum(len(line) for line in lines),
+        lines=len(lines),
+        tail=lines[-1] if lines else b'',
+        stamp=_current_stamp(),
+    )
 
 def _load() -> dict:
-    if not BANK_FILE.exists():
-        _save({'transfers': {}})
-    with open(BANK_FILE, 'r', encoding='utf-8') as f:
-        payload = json.load(f)
-    transfers = payload.get('transfers', {})
-    signature = payload.get('signature', '')
-    if _sign(transfers) != signature:
-        raise ValueError('Bank data signature mismatch')
-    return {'transfers': transfers}
+    """Bring the cached state up to date, verifying only lines appended since the last load."""
+    stamp = _current_stamp()
+    if stamp is None:
+        _reset_state()
+        return _state
+    if stamp == _state['stamp']:
+        return _state
+    with open(BANK_FILE, 'rb') as f:
+        # Stat the handle we read through, before reading, so anything
+        # appended meanwhile changes the stamp and is picked up next time.
+        stamp = _stamp(os.fstat(f.fileno()))
+        if stamp[1]:
+            # Scan the page cache directly; each line is copied out once and
+            # its signature and body are checked through views of that copy.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                _replay(mm)
+        else:
+            _reset_state()
+    _state['stamp'] = stamp
+    return _state
+
+def _replay(mm: mmap.mmap) -> None:
+    tail = _state['tail']
+    # If the bytes before our offset changed, the log was rewritten elsewhere.
+    if tail and mm[_state['offset'] - len(tail):_state['offset']] != tail:
+        _reset_state()
+    pos = _state['offset']
+    while True:
+        end = mm.find(b'\n', pos)
+        if end < 0:
+            break  # nothing more, or a line still being written by another process
+        line = mm[pos:end + 1]
+        record = _verify(line)
+        if record is None:
+            # A crash mid-append leaves a partial line without its newline and
+            # the next append lands right after it. JSON bodies never contain
+            # a raw tab, so the appended record starts _SIG_LEN bytes before
+            # the last one: skip the torn bytes ahead of it and verify it next.
+            torn = line.rfind(b'\t') - _SIG_LEN
+            if torn <= 0:
+                raise ValueError('Bank data signature mismatch')
+            _state['offset'] += torn
+            _state['tail'] = line[:torn]
+            pos += torn
+            continue
+        _accept(line, record)
+        pos = end + 1
 
 @contextmanager
-def _access_bank():
-    with _lock:
-        data = _load()
+def _access_bank(code: str):
+    with _lock_for(code):
+        with _lock:
+            data = _load()
         yield data
-        _save(data)
+    # A compacted log holds one line per transfer, so anything beyond that is
+    # a claim record that compacting would fold away.
+    if data['lines'] - len(data['transfers']) > COMPACT_THRESHOLD:
+        with _lock:
+            compact()
+
+def _candidate_codes(n: int = 8):
+    """Yield fresh 6-hex-digit codes, drawing randomness for ``n`` at a time."""
+    while True:
+        hexes = os.urandom(3 * n).hex().upper()
+        for i in range(0, len(hexes), 6):
+            yield hexes[i:i + 6]
 
 def create_transfer(user_id: str, amount: int, from_app: str, to_app: str) -> str:
     if not isinstance(amount, int) or amount <= 0:
         raise ValueError('Amount must be positive integer')
-    with _access_bank() as bank:
-        transfers = bank['transfers']
-        while True:
-            code = secrets.token_hex(3).upper()
-            if code not in transfers:
-                break
-        transfers[code] = {
-            'code': code,
-            'from_app': from_app,
-            'to_app': to_app,
-            'user_id': user_id,
-            'amount': amount,
-            'timestamp': time.time(),
-            'claimed': False,
-        }
-        return code
+    codes = _candidate_codes()
+    while True:
+        # Pick a code that looks free before taking any lock; the check is
+        # repeated under the lock against the freshly loaded state.
+        code = next(c for c in codes if c not in _state['transfers'])
+        with _access_bank(code) as bank:
+            if code in bank['transfers']:
+                continue  # taken by a line we had not replayed yet
+            transfer = {
+                'code': code,
+                'from_app': from_app,
+                'to_app': to_app,
+                'user_id': user_id,
+                'amount': amount,
+                'timestamp': time.time(),
+                'claimed': False,
+            }
+            _append({'event': 'create', 'transfer': transfer})
+            return code
 
 def claim_transfer(code: str, expect_to_app: str, user_id: str) -> tuple[int, str]:
     """Claim a transfer code and return the amount and originating app."""
-    with _access_bank() as bank:
+    with _access_bank(code) as bank:
         t = bank['transfers'].get(code)
         if not t:
             raise ValueError('Invalid code')
@@ -71,10 +241,15 @@ def claim_transfer(code: str, expect_to_app: str, user_id: str) -> tuple[int, st
             raise ValueError('Wrong destination')
         if t['user_id'] != user_id:
             raise ValueError('User mismatch')
-        t['claimed'] = True
+        _append({'event': 'claim', 'code': code})
         return t['amount'], t['from_app']
 
 def peek_transfer(code: str):
-    with _lock:
-        data = _load()
-    return data['transfers'].get(code)
+    # Read-only fast path: when the file is unchanged since the last sync, the
+    # cached record is current and needs no lock or HMAC check.
+    if _current_stamp() == _state['stamp']:
+        return _state['transfers'].get(code)
+    with _lock_for(code):
+        with _lock:
+            data = _load()
+        return data['transfers'].get(code)
@@ -1,13 +1,16 @@
 import json
 import os
 import random
-import subprocess
 import sys
 import time
+from typing import Optional
 
 import bank
 
 SAVE_FILE = "casino_save.json"
+# Opened once and rewritten in place; see save_wallet.
+_save_fd = None
+_save_size = 0
 
 
 def load_wallet() -> int:
@@ -18,9 +21,45 @@ def load_wallet() -> int:
     return 100
 
 
+def _open_save() -> int:
+    global _save_fd
+    if _save_fd is None:
+        _save_fd = os.open(SAVE_FILE, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0))
+    return _save_fd
+
+
 def save_wallet(wallet: int) -> None:
-    with open(SAVE_FILE, "w", encoding="utf-8") as f:
-        json.dump({"wallet": wallet}, f, indent=2)
+    # The record is padded to a fixed width so each save overwrites the same
+    # bytes at offset 0: no truncate, no reopen, one write.
+    global _save_size
+    buf = f'{{"wallet":{wallet:>20}}}\n'.encode()
+    fd = _open_save()
+    if hasattr(os, "pwrite"):
+        os.pwrite(fd, buf, 0)
+    else:  # Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, buf)
+    if len(buf) != _save_size:
+        os.ftruncate(fd, len(buf))
+        _save_size = len(buf)
+
+
+def sync_wallet() -> None:
+    """Flush the wallet file to disk; only needed when leaving the casino."""
+    if _save_fd is not None:
+        getattr(os, "fdatasync", os.fsync)(_save_fd)
+
+
+def get_bet(wallet: int) -> int:
+    while True:
+        try:
+            bet = int(input("Bet amount (>100): "))
+        except ValueError:
+            print("Invalid amount.")
+            continue
+        if 100 < bet <= wallet:
+            return bet
+        print("Bet must be >100 and ≤ wallet.")
 
 
 def one_or_two(wallet: int) -> int:
@@ -29,16 +68,7 @@ def one_or_two(wallet: int) -> int:
     if wallet <= 100:
         print("Need at least 101$ to play.")
         return wallet
-    while True:
-        try:
-            bet = int(input("Bet amount (>100): "))
-        except ValueError:
-            print("Invalid amount.")
-            continue
-        if bet <= 100 or bet > wallet:
-            print("Bet must be >100 and ≤ wallet.")
-            continue
-        break
+    bet = get_bet(wallet)
     while True:
         guess = input("Pick 1 or 2: ").strip()
         if guess in ("1", "2"):
@@ -56,8 +86,15 @@ def one_or_two(wallet: int) -> int:
     return wallet
 
 
+CLEAR = "\x1b[2J\x1b[H"  # ANSI clear screen + cursor home
+
+
 def clear_screen() -> None:
-    os.system("cls" if os.name == "nt" else "clear")
+    if os.name == "nt":
+        os.system("cls")
+    else:
+        sys.stdout.write(CLEAR)
+        sys.stdout.flush()
 
 
 def horse_race(wallet: int) -> int:
@@ -66,16 +103,7 @@ def horse_race(wallet: int) -> int:
     if wallet <= 100:
         print("Need at least 101$ to play.")
         return wallet
-    while True:
-        try:
-            bet = int(input("Bet amount (>100): "))
-        except ValueError:
-            print("Invalid amount.")
-            continue
-        if bet <= 100 or bet > wallet:
-            print("Bet must be >100 and ≤ wallet.")
-            continue
-        break
+    bet = get_bet(wallet)
     horses = ["A", "B", "C"]
     while True:
         pick = input("Choose your horse (A/B/C): ").strip().upper()
@@ -84,14 +112,23 @@ def horse_race(wallet: int) -> int:
         print("Invalid horse.")
     positions = {h: 0 for h in horses}
     finish = 20
+    # Every horse moves at least 1 per frame, so the race ends within `finish`
+    # frames; draw all steps up front in one call.
+    steps = iter(random.choices((1, 2, 3), k=finish * len(horses)))
+    # No horse can get past finish + 2, so every track is a prefix of this.
+    track = "." * (finish + 3)
     while True:
-        clear_screen()
-        for h in horses:
-            track = "." * positions[h] + h
-            print(track)
+        # Draw the whole frame with a single write instead of one print per horse.
+        frame = "\n".join(track[:positions[h]] + h for h in horses) + "\n"
+        if os.name == "nt":
+            clear_screen()
+        else:
+            frame = CLEAR + frame
+        sys.stdout.write(frame)
+        sys.stdout.flush()
         time.sleep(0.2)
         for h in horses:
-            positions[h] += random.randint(1, 3)
+            positions[h] += next(steps)
         if max(positions.values()) >= finish:
             break
     winner = max(positions, key=positions.get)
@@ -114,7 +151,7 @@ def random_spin(wallet: int) -> int:
         print("Need at least 1000$ for a spin.")
         return wallet
     wallet -= 1000
-    win = random.random() < 0.5
+    win = random.getrandbits(1) == 1
     if win:
         wallet += 2000
         print("Paid 1000 -> Won 2000 (WIN)")
@@ -124,7 +161,8 @@ def random_spin(wallet: int) -> int:
     return wallet
 
 
-def bank_menu(wallet: int, user_id: str) -> int:
+def bank_menu(wallet: int, user_id: str) -> tuple[int, Optional[list[str]]]:
+    """Returns the wallet and, if the player moved to fishing, the argv to hand over with."""
     while True:
         print(f"\n--- Bank ---\nWallet: {wallet}$")
         print("(P) Pay to Fishing")
@@ -139,19 +177,22 @@ def bank_menu(wallet: int, user_id: str) -> int:
             if amount <= 0 or amount > wallet:
                 print("Invalid amount.")
                 continue
+            # Record the transfer before debiting so a failed create never
+            # leaves the wallet short; the debit is then a single save.
+            code = bank.create_transfer(user_id, amount, from_app="casino", to_app="fishing")
             wallet -= amount
             save_wallet(wallet)
-            code = bank.create_transfer(user_id, amount, from_app="casino", to_app="fishing")
-            subprocess.Popen([sys.executable, "fishing.py", "--autoclaim", code, "--user", user_id])
-            sys.exit(0)
+            sync_wallet()
+            return wallet, ["fishing.py", "--autoclaim", code, "--user", user_id]
         elif action == "Q":
             break
         else:
             print("Invalid choice.")
-    return wallet
+    return wallet, None
 
 
-def main() -> None:
+def main() -> Optional[list[str]]:
+    """Run the casino; returns the argv of the game to switch to, if any."""
     args = sys.argv[1:]
     autoclaim_code = None
     autoclaim_user = None
@@ -189,18 +230,23 @@ def main() -> None:
         elif choice == "3":
             wallet = random_spin(wallet)
         elif choice == "4":
-            wallet = bank_menu(wallet, user_id)
+            wallet, handoff = bank_menu(wallet, user_id)
+            if handoff:
+                return handoff
         elif choice == "5":
             save_wallet(wallet)
-            subprocess.Popen([sys.executable, "fishing.py"])
-            sys.exit(0)
+            sync_wallet()
+            return ["fishing.py"]
         elif choice == "6":
             save_wallet(wallet)
+            sync_wallet()
             break
         else:
             print("Invalid choice.")
 
 
 if __name__ == "__main__":
-    main()
+    import fishing
+
+    fishing.play(["casino.py", *sys.argv[1:]])
 
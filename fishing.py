@@ -7,28 +7,31 @@ import os
 import random
 import time
 import sys
-import select
 import hashlib
 import hmac
-import subprocess
 import bank
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Sequence
+from contextlib import contextmanager
+from itertools import islice
+from dataclasses import dataclass
 try:
-    import curses
-except Exception:  # pragma: no cover - curses may be missing on some platforms
-    curses = None
-
-if sys.platform == 'win32':
-    import msvcrt
-else:
-    import tty
-    import termios
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is used otherwise
+    orjson = None
 
 # --------------------------- Utility functions ---------------------------
 
+CLEAR = "\x1b[2J\x1b[H"  # ANSI clear screen + cursor home
+# Minigame frame: cursor home, then three lines each erased to end of line
+FRAME = "\x1b[H%s\x1b[K\n%s\x1b[K\n%s\x1b[K\n"
+
+
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        sys.stdout.write(CLEAR)
+        sys.stdout.flush()
 
 # Simple ANSI color mapping (no external deps)
 COLORS = {
@@ -43,8 +46,23 @@ COLORS = {
     "Reset": "\033[0m",
 }
 
+# Prebuilt "<code>%s<reset>" templates so color_text is one lookup and one format
+COLORED = {name: code + "%s" + COLORS["Reset"] for name, code in COLORS.items()}
+
 def color_text(text: str, color: str) -> str:
-    return f"{COLORS.get(color, COLORS['White'])}{text}{COLORS['Reset']}"
+    return COLORED.get(color, COLORED["White"]) % text
+
+# Display color per rarity; anything else is shown in White
+RARITY_COLOR = {
+    "Common": "DarkGray",
+    "Uncommon": "Green",
+    "Rare": "Magenta",
+    "Epic": "Cyan",
+    "Legendary": "Yellow",
+    "Mythical": "DarkYellow",
+    "Exotic": "Red",
+    "???": "Red",
+}
 
 # Season helpers
 SEASONS = ["Spring", "Summer", "Autumn", "Winter"]
@@ -60,7 +78,7 @@ SEASONAL_ZONES = {
     "Spring": {
         "id": "Spring Grove",
         "desc": "Blooming waters full of life.",
-        "fish": [
+        "fish": (
             {"name": "Blossom Minnow", "rarity": "Common", "price": 60, "xp": 6},
             {"name": "Petal Carp", "rarity": "Common", "price": 65, "xp": 6},
             {"name": "Willow Perch", "rarity": "Common", "price": 70, "xp": 7},
@@ -71,12 +89,12 @@ SEASONAL_ZONES = {
             {"name": "Spirit Koi of Dawn", "rarity": "Mythical", "price": 900, "xp": 120},
             {"name": "Sunray Bass", "rarity": "Legendary", "price": 1800, "xp": 220},
             {"name": "Sakura Koi (Seasonal)", "rarity": "Legendary", "price": 2600, "xp": 300},
-        ],
+        ),
     },
     "Summer": {
         "id": "Summer Maelstrom",
         "desc": "Warm swirling currents.",
-        "fish": [
+        "fish": (
             {"name": "Warmwater Bluegill", "rarity": "Common", "price": 65, "xp": 6},
             {"name": "Golden Tilapia", "rarity": "Common", "price": 70, "xp": 7},
             {"name": "Sun Perch", "rarity": "Common", "price": 75, "xp": 7},
@@ -87,12 +105,12 @@ SEASONAL_ZONES = {
             {"name": "Mirage Eel", "rarity": "Mythical", "price": 1000, "xp": 140},
             {"name": "Sunmarrow Tuna", "rarity": "Legendary", "price": 1900, "xp": 230},
             {"name": "Sunray Marlin (Seasonal)", "rarity": "Legendary", "price": 3000, "xp": 360},
-        ],
+        ),
     },
     "Autumn": {
         "id": "Autumn Mire",
         "desc": "Foggy, leaf-strewn shallows.",
-        "fish": [
+        "fish": (
             {"name": "Copper Dace", "rarity": "Common", "price": 60, "xp": 6},
             {"name": "Maple Roach", "rarity": "Common", "price": 65, "xp": 6},
             {"name": "Amber Smelt", "rarity": "Common", "price": 70, "xp": 7},
@@ -103,12 +121,12 @@ SEASONAL_ZONES = {
             {"name": "Wisp Carp", "rarity": "Mythical", "price": 1050, "xp": 150},
             {"name": "Equinox Sturgeon", "rarity": "Legendary", "price": 2000, "xp": 240},
             {"name": "Harvest Leviathanling (Seasonal)", "rarity": "Legendary", "price": 2900, "xp": 360},
-        ],
+        ),
     },
     "Winter": {
         "id": "Winter Fjord",
         "desc": "Frozen depths with lurking predators.",
-        "fish": [
+        "fish": (
             {"name": "Ice Minnow", "rarity": "Common", "price": 65, "xp": 6},
             {"name": "Frost Perch", "rarity": "Common", "price": 70, "xp": 7},
             {"name": "Pale Smelt", "rarity": "Common", "price": 75, "xp": 7},
@@ -119,7 +137,7 @@ SEASONAL_ZONES = {
             {"name": "Ice Wyrm Eel", "rarity": "Mythical", "price": 1100, "xp": 160},
             {"name": "Glacial Shark", "rarity": "Legendary", "price": 2100, "xp": 260},
             {"name": "Frost Dragonfish (Seasonal)", "rarity": "Legendary", "price": 3200, "xp": 380},
-        ],
+        ),
     },
 }
 
@@ -173,10 +191,13 @@ SEASONAL_FISH = {
   }
 }
 
-# Non-blocking keyboard helpers
+# Non-blocking keyboard helpers. The console modules are imported on first use
+# so loading the game data does not pull in terminal handling.
 class RawInput:
     def __enter__(self):
         if sys.platform != 'win32':
+            import termios
+            import tty
             self.fd = sys.stdin.fileno()
             self.old_settings = termios.tcgetattr(self.fd)
             tty.setcbreak(self.fd)
@@ -184,16 +205,20 @@ class RawInput:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if sys.platform != 'win32':
+            import termios
             termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
 
 def key_pressed():
     if sys.platform == 'win32':
+        import msvcrt
         return msvcrt.kbhit()
+    import select
     dr, _, _ = select.select([sys.stdin], [], [], 0)
     return dr != []
 
 def read_key():
     if sys.platform == 'win32':
+        import msvcrt
         ch = msvcrt.getwch()
         if ch in ('\x00', '\xe0'):
             msvcrt.getwch()
@@ -201,17 +226,61 @@ def read_key():
         return ch
     return sys.stdin.read(1)
 
+def wait_key(timeout: float) -> Optional[str]:
+    """Wait up to ``timeout`` seconds for a key press and return it, else None."""
+    if sys.platform == 'win32':
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if key_pressed():
+                return read_key()
+            time.sleep(0.001)
+    else:
+        import select
+        dr, _, _ = select.select([sys.stdin], [], [], timeout)
+        if dr:
+            return read_key()
+    # Handle key presses that occur exactly as the timer ends
+    if key_pressed():
+        return read_key()
+    return None
+
 ENTER_KEYS = ('\r', '\n', '\r\n', '\x0d')
 
 # Secret key for save file signature
 SAVE_SIGNATURE_KEY = os.environ.get('SAVE_SIGNATURE_KEY', 'default_save_signature_key')
+_SAVE_KEY_BYTES = SAVE_SIGNATURE_KEY.encode('utf-8')
+# Keyed HMAC state (inner/outer pads already absorbed); each signature copies it.
+_SAVE_HMAC = hmac.new(_SAVE_KEY_BYTES, digestmod=hashlib.sha256)
+
+
+def _save_hmac(payload: bytes) -> bytes:
+    h = _SAVE_HMAC.copy()
+    h.update(payload)
+    return h.digest()
+
+
+def _canonical_bytes(data: Dict) -> bytes:
+    """Serialize data as the compact, key-sorted JSON that save signatures cover."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def compute_save_signature(data: Dict) -> str:
     """Compute HMAC-SHA256 signature for given data using canonical JSON."""
+    return _save_hmac(_canonical_bytes(data)).hex()
+
+
+def compute_legacy_save_signature(data: Dict) -> str:
+    """Signature over the ASCII-escaped stdlib encoding used by older saves."""
     serialized = json.dumps(data, sort_keys=True, separators=(',', ':'))
-    key = SAVE_SIGNATURE_KEY.encode('utf-8')
-    return hmac.new(key, serialized.encode('utf-8'), hashlib.sha256).hexdigest()
+    return _save_hmac(serialized.encode('utf-8')).hex()
 
 # [FISH_TRAP HELPERS]
 
@@ -219,21 +288,26 @@ def format_remaining_time(seconds: float) -> str:
     """Return human readable H:M:S string for given seconds."""
     if seconds <= 0:
         return "0s"
-    m, s = divmod(int(seconds), 60)
-    h, m = divmod(m, 60)
-    parts = []
-    if h:
-        parts.append(f"{h}h")
-    if m:
-        parts.append(f"{m}m")
-    if s or not parts:
-        parts.append(f"{s}s")
-    return " ".join(parts)
+    h, rem = divmod(int(seconds), 3600)
+    m, s = divmod(rem, 60)
+    if not h and not m:
+        return f"{s}s"
+    text = f"{h}h {m}m" if h and m else (f"{h}h" if h else f"{m}m")
+    return f"{text} {s}s" if s else text
 
 # Boss spawn chance configuration
 BASE_BOSS_CHANCE = 0.10  # existing base chance (10%)
 BOSS_BONUS_PER_STREAK = 0.005  # additional 0.5% per streak
 BOSS_CHANCE_CAP = 0.20  # maximum 20% chance
+BOSS_FULL_MOON_BONUS = 0.10  # extra chance on Full Moon Night
+
+
+def boss_spawn_chance(streak: int, full_moon_night: bool = False) -> float:
+    """Return the capped boss spawn chance for a normal cast."""
+    return min(
+        BASE_BOSS_CHANCE + streak * BOSS_BONUS_PER_STREAK + (BOSS_FULL_MOON_BONUS if full_moon_night else 0),
+        BOSS_CHANCE_CAP,
+    )
 
 # Floating Island appearance chance
 FLOATING_ISLAND_DAILY_CHANCE = 0.30
@@ -518,7 +592,7 @@ ACHIEVEMENTS = {
 
 # --------------------------- Fish data ---------------------------
 
-FISH_LAKE = [
+FISH_LAKE = (
     {"name": "Carp", "rarity": "Common", "price": 1, "xp": 5, "seasons": ["Spring", "Summer"]},
     {"name": "Tilapia", "rarity": "Common", "price": 1.25, "xp": 5},
     {"name": "Grass carp", "rarity": "Uncommon", "price": 5, "xp": 7},
@@ -534,9 +608,9 @@ FISH_LAKE = [
     {"name": "Lake Sturgeon", "rarity": "Rare", "price": 20, "xp": 25},
     {"name": "White Bass", "rarity": "Uncommon", "price": 6, "xp": 8},
     {"name": "Channel Catfish", "rarity": "Rare", "price": 18, "xp": 20},
-]
+)
 
-FISH_SEA = [
+FISH_SEA = (
     {"name": "Starfish", "rarity": "Uncommon", "base_price": 1.25, "xp": 7},
     {"name": "Tuna", "rarity": "Rare", "base_price": 2, "xp": 10},
     {"name": "Shark", "rarity": "Rare", "base_price": 7, "xp": 10},
@@ -557,9 +631,9 @@ FISH_SEA = [
     {"name": "Grouper", "rarity": "Uncommon", "base_price": 12, "xp": 16},
     {"name": "Triggerfish", "rarity": "Rare", "base_price": 20, "xp": 25},
     {"name": "Napoleon Wrasse", "rarity": "Legendary", "base_price": 60, "xp": 80},
-]
+)
 
-FISH_BATHYAL = [
+FISH_BATHYAL = (
     {"name": "Deep-sea Dragonfish", "rarity": "Rare", "base_price": 35, "xp": 45},
     {"name": "Lanternfish", "rarity": "Uncommon", "base_price": 15, "xp": 18},
     {"name": "Anglerfish", "rarity": "Uncommon", "base_price": 20, "xp": 25},
@@ -570,9 +644,9 @@ FISH_BATHYAL = [
     {"name": "Giant Squid", "rarity": "Legendary", "base_price": 80, "xp": 100},
     {"name": "Brilliant Lanternfish", "rarity": "Rare", "base_price": 18, "xp": 22},
     {"name": "Swallowtail", "rarity": "Uncommon", "base_price": 12, "xp": 15},
-]
+)
 
-FISH_ABYSS_TRENCH = [
+FISH_ABYSS_TRENCH = (
     {"name": "Lanternfish", "rarity": "Common", "price": 15},
     {"name": "Angler Leviathan", "rarity": "Legendary", "price": 100, "xp": 150},
     {"name": "Giant Squid", "rarity": "Legendary", "price": 75, "xp": 100},
@@ -595,9 +669,9 @@ FISH_ABYSS_TRENCH = [
     {"name": "Abyssal Cusk Eel", "rarity": "Common", "price": 20, "xp": 30},
     {"name": "Abyssal Lanternfish", "rarity": "Uncommon", "price": 25, "xp": 40},
     {"name": "Giant Fangtooth", "rarity": "Legendary", "price": 100, "xp": 150},
-]
+)
 
-FISH_ANCIENT_SEA = [
+FISH_ANCIENT_SEA = (
     {"name": "Mosasaurus", "rarity": "Legendary", "price": 350, "xp": 500},
     {"name": "Dunkleosteus", "rarity": "Mythical", "price": 500, "xp": 700},
     {"name": "Megalodon", "rarity": "Mythical", "price": 1000, "xp": 1500},
@@ -609,9 +683,9 @@ FISH_ANCIENT_SEA = [
     {"name": "Tyrannosaurus Rex", "rarity": "Mythical", "price": 600, "xp": 800},
     {"name": "Sharksaurus", "rarity": "Legendary", "price": 450, "xp": 600},
     {"name": "Acanthodes", "rarity": "Exotic", "price": 300, "xp": 350},
-]
+)
 
-FISH_MYSTIC_SPRING = [
+FISH_MYSTIC_SPRING = (
     {"name": "Prism Trout", "rarity": "Rare", "price": 15, "xp": 10},
     {"name": "Spirit Koi", "rarity": "Epic", "price": 25, "xp": 25},
     {"name": "Phoenix Scale Carp", "rarity": "Mythical", "price": 50, "xp": 40},
@@ -625,9 +699,9 @@ FISH_MYSTIC_SPRING = [
     {"name": "Luminous Catfish", "rarity": "Uncommon", "price": 25, "xp": 35},
     {"name": "Frostfin Koi", "rarity": "Rare", "price": 50, "xp": 70},
     {"name": "Glimmering Angelfish", "rarity": "Epic", "price": 60, "xp": 80},
-]
+)
 
-FISH_FLOATING_ISLAND = [
+FISH_FLOATING_ISLAND = (
     {"name": "Cloud Carp", "rarity": "Uncommon", "price": 35, "xp": 40},
     {"name": "Sky Ray", "rarity": "Rare", "price": 90, "xp": 110},
     {"name": "Aurora Koi", "rarity": "Epic", "price": 140, "xp": 170},
@@ -636,7 +710,7 @@ FISH_FLOATING_ISLAND = [
     {"name": "Radiant Sunfish", "rarity": "Legendary", "price": 240, "xp": 280},
     {"name": "Nimbus Marlin", "rarity": "Legendary", "price": 210, "xp": 260},
     {"name": "Celestial Marlin", "rarity": "Mythical", "price": 320, "xp": 380},
-]
+)
 
 # Boss definitions for each zone
 ZONE_BOSS_MAP = {
@@ -670,19 +744,19 @@ ZONE_BOSS_MAP = {
     },
 }
 
-# Inject boss fish into zone fish lists
-FISH_LAKE.append({"name": ZONE_BOSS_MAP["Lake"]["name"], "rarity": "???", "price": 1000, "xp": 6000})
-FISH_SEA.append({"name": ZONE_BOSS_MAP["Sea"]["name"], "rarity": "???", "base_price": 1000, "xp": 7000})
-FISH_BATHYAL.append({"name": ZONE_BOSS_MAP["Bathyal"]["name"], "rarity": "???", "base_price": 1000, "xp": 8000})
-FISH_MYSTIC_SPRING.append({"name": ZONE_BOSS_MAP["Mystic Spring"]["name"], "rarity": "???", "price": 1000, "xp": 9000})
-FISH_ABYSS_TRENCH.append({"name": ZONE_BOSS_MAP["Abyss Trench"]["name"], "rarity": "???", "price": 1000, "xp": 9500})
-FISH_ANCIENT_SEA.append({"name": ZONE_BOSS_MAP["Ancient Sea"]["name"], "rarity": "???", "price": 1000, "xp": 10000})
-FISH_FLOATING_ISLAND.append({
+# Inject boss fish into zone fish tables (tuples: nothing mutates them after import)
+FISH_LAKE += ({"name": ZONE_BOSS_MAP["Lake"]["name"], "rarity": "???", "price": 1000, "xp": 6000},)
+FISH_SEA += ({"name": ZONE_BOSS_MAP["Sea"]["name"], "rarity": "???", "base_price": 1000, "xp": 7000},)
+FISH_BATHYAL += ({"name": ZONE_BOSS_MAP["Bathyal"]["name"], "rarity": "???", "base_price": 1000, "xp": 8000},)
+FISH_MYSTIC_SPRING += ({"name": ZONE_BOSS_MAP["Mystic Spring"]["name"], "rarity": "???", "price": 1000, "xp": 9000},)
+FISH_ABYSS_TRENCH += ({"name": ZONE_BOSS_MAP["Abyss Trench"]["name"], "rarity": "???", "price": 1000, "xp": 9500},)
+FISH_ANCIENT_SEA += ({"name": ZONE_BOSS_MAP["Ancient Sea"]["name"], "rarity": "???", "price": 1000, "xp": 10000},)
+FISH_FLOATING_ISLAND += ({
     "name": ZONE_BOSS_MAP["Floating Island"]["name"],
     "rarity": "???",
     "price": 1200,
     "xp": 8500,
-})
+},)
 
 # Map zones to their fish lists for easy lookup throughout the game
 ZONE_FISH_MAP = {
@@ -695,6 +769,65 @@ ZONE_FISH_MAP = {
     "Floating Island": FISH_FLOATING_ISLAND,
 }
 
+# Zone menu: choice -> (zone, menu note, catch length, unlock attribute,
+# locked message, chosen message)
+ZONE_MENU = {
+    "1": ("Sea", " (Need Boat)", 3, "has_boat",
+          "You don't have a boat to access Sea zone.",
+          "You chose Sea zone. Catch zone length set to 3."),
+    "2": ("Lake", "", 5, None, None,
+          "You chose Lake zone. Catch zone length set to 5."),
+    "3": ("Bathyal", " (Need Submarine)", 5, "has_submarine",
+          "You don't have a submarine to access Bathyal zone.",
+          "You chose Bathyal zone. Minigame speed x4 faster."),
+    "4": ("Mystic Spring", " (Need Torch)", 5, "has_torch",
+          "You don't have a Torch to access Mystic Spring.",
+          "You chose Mystic Spring. Minigame speed x2 faster."),
+    "5": ("Abyss Trench", " (Need Submarine Upgrade 01)", 4, "has_abyss_trench_access",
+          "You don't have Submarine Upgrade 01 to access Abyss Trench.",
+          "You chose Abyss Trench. Minigame speed x7 faster."),
+    "6": ("Ancient Sea", " (Need Submarine Upgrade 02)", 3, "has_ancient_sea_access",
+          "You don't have access to Ancient Sea.",
+          "You chose Ancient Sea. Minigame speed x10 faster."),
+    "7": ("Floating Island", " (Need Floating Key; 12–16h if visible)", 2, "has_floating_key",
+          "You need the FLOATING KEY.",
+          "You reached the Floating Island. Minigame is much harder!"),
+}
+
+# Purchasable zones in unlock-list order: (zone, unlock attribute)
+ZONE_UNLOCKS = (
+    ("Sea", "has_boat"),
+    ("Bathyal", "has_submarine"),
+    ("Mystic Spring", "has_torch"),
+    ("Abyss Trench", "has_abyss_trench_access"),
+    ("Ancient Sea", "has_ancient_sea_access"),
+)
+
+# Minigame frame delay in seconds; deeper zones run faster
+BASE_SPEED = 0.1
+ZONE_SPEED = {
+    "Sea": max(BASE_SPEED / 2, 0.01),
+    "Mystic Spring": max(BASE_SPEED / 2, 0.01),
+    "Bathyal": max(BASE_SPEED / 4, 0.01),
+    "Abyss Trench": max(BASE_SPEED / 7, 0.01),
+    "Ancient Sea": max(BASE_SPEED / 10, 0.01),
+    "Floating Island": max(BASE_SPEED / 12, 0.005),
+}
+
+# Per-zone lookups derived once from ZONE_FISH_MAP:
+# ZONE_BY_NAME maps fish name -> record, ZONE_NONBOSS_FISH holds the fish quests
+# may target (no boss or Exotic), ZONE_RARITIES their distinct rarities in table order.
+ZONE_BY_NAME: Dict[str, Dict[str, Dict]] = {}
+ZONE_NONBOSS_FISH: Dict[str, tuple] = {}
+ZONE_RARITIES: Dict[str, tuple] = {}
+for _zone, _fish in ZONE_FISH_MAP.items():
+    ZONE_BY_NAME[_zone] = {}
+    for _f in _fish:
+        ZONE_BY_NAME[_zone].setdefault(_f["name"], _f)
+    ZONE_NONBOSS_FISH[_zone] = tuple(f for f in _fish if f.get("rarity") not in ("???", "Exotic"))
+    ZONE_RARITIES[_zone] = tuple(dict.fromkeys(f["rarity"] for f in ZONE_NONBOSS_FISH[_zone]))
+del _zone, _fish, _f
+
 # Base reward values per rarity used for quest reward calculation
 RARITY_BASE_REWARD = {
     "Common": 10,
@@ -706,11 +839,131 @@ RARITY_BASE_REWARD = {
     "Exotic": 640,
 }
 
-EXOTIC_FISH_FULL_MOON = [
+# Per-unit reward for freshly generated quests
+QUEST_BASE_REWARD = {
+    "Common": 10,
+    "Uncommon": 20,
+    "Rare": 100,
+    "Epic": 175,
+    "Mythical": 200,
+    "Legendary": 500,
+    "Boss": 10000,
+}
+
+EXOTIC_FISH_FULL_MOON = (
     {"name": "Phantom Shark", "rarity": "Exotic", "price": 100, "xp": 1000},
     {"name": "Shadowfin", "rarity": "Exotic", "price": 100, "xp": 1000},
     {"name": "Abyssal Ghost", "rarity": "Exotic", "price": 100, "xp": 1000},
-]
+)
+
+# Rarity -> (relative catch weight, counts towards the rare pool). Exotic fish
+# only bite during exotic events, where EXOTIC_RARITY_INFO applies instead.
+FISH_RARITY_INFO = {
+    'Common': (5, False),
+    'Uncommon': (3, False),
+    'Rare': (2, True),
+    'Epic': (1, True),
+    'Legendary': (1, True),
+    'Mythical': (1, True),
+    'Exotic': (0, False),
+}
+EXOTIC_RARITY_INFO = {**FISH_RARITY_INFO, 'Exotic': (1, True)}
+# Daily events that let Exotic fish bite
+EXOTIC_EVENTS = frozenset(("Exotic Surge", "Full Moon Night"))
+TIMES_OF_DAY = ("Day", "Sunset", "Night")
+# Clock hour -> time of day; hours outside 0-23 count as night
+HOUR_TIME_OF_DAY = {
+    hour: "Day" if 6 <= hour < 18 else "Sunset" if 18 <= hour < 22 else "Night"
+    for hour in range(24)
+}
+
+
+def build_fish_sampler(fish_list: Sequence[Dict], time_of_day: str, season: str, exotic: bool) -> tuple:
+    """Return ``(filtered, rare, rare_cum, common, common_cum)`` for weighted catches.
+
+    ``filtered`` is every fish that can bite at this time and season (bosses
+    excluded); the rare and common pools carry cumulative weights for
+    ``random.choices``.
+    """
+    if exotic:
+        fish_list = tuple(fish_list) + EXOTIC_FISH_FULL_MOON
+        info = EXOTIC_RARITY_INFO
+    else:
+        info = FISH_RARITY_INFO
+    filtered = tuple(
+        f for f in fish_list
+        if f.get('rarity') != '???'
+        and (not f.get('time_of_day') or time_of_day in f['time_of_day'])
+        and (not f.get('seasons') or season in f['seasons'])
+    ) or tuple(fish_list)
+    rare: List[Dict] = []
+    rare_cum: List[int] = []
+    common: List[Dict] = []
+    common_cum: List[int] = []
+    for fish in filtered:
+        weight, is_rare = info.get(fish.get('rarity', 'Common'), (3, False))
+        if not weight:
+            continue
+        pool, cum = (rare, rare_cum) if is_rare else (common, common_cum)
+        pool.append(fish)
+        cum.append((cum[-1] if cum else 0) + weight)
+    return filtered, tuple(rare), tuple(rare_cum), tuple(common), tuple(common_cum)
+
+
+# Every zone's catch table, seasonal zones included, keyed by zone id
+ZONE_TABLES = {**ZONE_FISH_MAP, **{z['id']: z['fish'] for z in SEASONAL_ZONES.values()}}
+# Samplers for each (zone, time of day, season, exotic event) combination.
+# Zones where no fish is limited by time or season share one sampler per
+# exotic state across every clock key.
+ZONE_SAMPLER: Dict[tuple, tuple] = {}
+for _zone, _fish in ZONE_TABLES.items():
+    _timed = any(f.get('time_of_day') or f.get('seasons') for f in _fish)
+    for _exotic in (False, True):
+        _shared = None if _timed else build_fish_sampler(_fish, TIMES_OF_DAY[0], SEASONS[0], _exotic)
+        for _tod in TIMES_OF_DAY:
+            for _season in SEASONS:
+                ZONE_SAMPLER[_zone, _tod, _season, _exotic] = (
+                    _shared or build_fish_sampler(_fish, _tod, _season, _exotic)
+                )
+del _zone, _fish, _timed, _exotic, _shared, _tod, _season
+
+# Catch weight ranges in kg: (low, high, whole kilograms)
+FISH_WEIGHT_RANGES = {
+    "Shark": (50, 1000, True),
+    "Whale": (100, 10000, True),
+    "Tuna": (10, 75, True),
+    "Flying Fish": (1, 3, False),
+    "Swordfish": (100, 300, True),
+    "Electric Eel": (10, 50, True),
+    "Lionfish": (2, 6, False),
+    "Giant Blue Marlin": (300, 800, True),
+    "Sunfish": (500, 1500, True),
+    "Deep-sea Dragonfish": (5, 20, True),
+    "Lanternfish": (5, 15, True),
+    "Anglerfish": (10, 25, True),
+    "Black Swallower": (2, 10, True),
+    "Goblin Shark": (50, 100, True),
+    "Angler Leviathan": (15, 100, True),
+    "Giant Squid": (1000, 5000, True),
+    "Ancient Key": (100, 500, True),
+    "Mosasaurus": (1000, 3000, True),
+    "Dunkleosteus": (1000, 3000, True),
+    "Megalodon": (10000, 50000, True),
+    "Leedsichthys": (100000, 1000000, True),
+    "Prism Trout": (20, 80, True),
+    "Spirit Koi": (20, 150, True),
+    "Phoenix Scale Carp": (100, 300, True),
+}
+
+# Fallback weight ranges for fish without an entry above
+RARITY_WEIGHT_RANGES = {
+    "Common": (0.5, 2.5),
+    "Uncommon": (1.0, 4.0),
+    "Rare": (2.0, 6.0),
+    "Epic": (3.0, 8.0),
+    "Legendary": (5.0, 12.0),
+    "Mythical": (8.0, 20.0),
+}
 
 SEA_PRICE_MULTIPLIER = {
     "Uncommon": 1.25,
@@ -720,6 +973,22 @@ SEA_PRICE_MULTIPLIER = {
     "Mythical": 7,
 }
 
+
+def _sea_price(fish: Dict) -> float:
+    return round(fish.get('base_price', fish.get('price', 0)) * SEA_PRICE_MULTIPLIER.get(fish['rarity'], 1), 2)
+
+
+def _bathyal_price(fish: Dict) -> float:
+    return fish.get('base_price', fish.get('price', 0))
+
+
+def _default_price(fish: Dict) -> float:
+    return fish.get('price', 0)
+
+
+# per-zone pricing shared by obtain_fish, fast_fishing and resolve_trap
+PRICE_FN = {"Sea": _sea_price, "Bathyal": _bathyal_price}
+
 SHOP_ITEMS = [
     {"name": "Boat", "price": 25000, "description": "Access Sea zone"},
     {"name": "Submarine", "price": 1000000, "description": "Access Bathyal zone"},
@@ -752,14 +1021,41 @@ BAIT_PRICES = {
     "legend": 1500000,
 }
 
+BAIT_NAMES = {
+    "normal": "Normal Bait",
+    "advanced": "Advanced Bait",
+    "expert": "Expert Bait",
+    "legend": "Legend Bait",
+}
+
+# Trap shop menu choice -> BAIT_PRICES item
+BAIT_SHOP_MAP = {"1": "trap", "2": "normal", "3": "advanced", "4": "expert", "5": "legend"}
+
 BAIT_RARITY_MAP = {
-    "normal": ["Common", "Uncommon"],
-    "advanced": ["Rare", "Epic"],
-    "expert": ["Legendary", "Mythical"],
-    "legend": ["Exotic", "???"],
+    "normal": frozenset({"Common", "Uncommon"}),
+    "advanced": frozenset({"Rare", "Epic"}),
+    "expert": frozenset({"Legendary", "Mythical"}),
+    "legend": frozenset({"Exotic", "???"}),
+}
+
+# Trap catch tables derived once from ZONE_FISH_MAP: each zone's boss record,
+# its non-boss fish, and per (zone, bait) the fish that bait attracts in table
+# order, falling back to every non-boss fish when none match.
+ZONE_BOSS_FISH = {
+    zone: next((f for f in fish if f['rarity'] == '???'), None)
+    for zone, fish in ZONE_FISH_MAP.items()
+}
+ZONE_CATCHABLE = {
+    zone: tuple(f for f in fish if f['rarity'] != '???')
+    for zone, fish in ZONE_FISH_MAP.items()
+}
+TRAP_POOLS = {
+    (zone, bait): tuple(f for f in catchable if f['rarity'] in rarities) or catchable
+    for zone, catchable in ZONE_CATCHABLE.items()
+    for bait, rarities in BAIT_RARITY_MAP.items()
 }
 
-@dataclass
+@dataclass(slots=True)
 class Quest:
     """Represents a quest tied to a specific zone."""
 
@@ -772,7 +1068,15 @@ class Quest:
     reward: int = 0
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'quest_type': self.quest_type,
+            'zone': self.zone,
+            'target_fish': self.target_fish,
+            'rarity': self.rarity,
+            'amount': self.amount,
+            'progress': self.progress,
+            'reward': self.reward,
+        }
 
     def is_completed(self) -> bool:
         return self.progress >= self.amount
@@ -797,12 +1101,10 @@ class QuestManager:
                     if quest.reward == 0:
                         rarity = quest.rarity
                         if quest.quest_type == 1 and not rarity:
-                            fish_list = ZONE_FISH_MAP.get(zone, [])
-                            for f in fish_list:
-                                if f["name"] == quest.target_fish:
-                                    rarity = f["rarity"]
-                                    quest.rarity = rarity
-                                    break
+                            f = ZONE_BY_NAME.get(zone, {}).get(quest.target_fish)
+                            if f:
+                                rarity = f["rarity"]
+                                quest.rarity = rarity
                         base = RARITY_BASE_REWARD.get(rarity, 10)
                         quest.reward = base * quest.amount
         # Ensure every zone has a quest list
@@ -812,9 +1114,9 @@ class QuestManager:
             # Trim excess quests and fill up to 10
             self.zone_quests[zone] = self.zone_quests[zone][:10]
             self.original_amounts[zone] = self.original_amounts[zone][:10]
-            while len(self.zone_quests[zone]) < 10:
-                quest = self.generate_quest(zone)
-                self.zone_quests[zone].append(quest)
+            missing = 10 - len(self.zone_quests[zone])
+            if missing > 0:
+                self.zone_quests[zone].extend(self._bulk_generate(zone, missing))
         
     def to_dict(self) -> Dict[str, List[Dict]]:
         return {zone: [q.to_dict() for q in quests] for zone, quests in self.zone_quests.items()}
@@ -835,53 +1137,48 @@ class QuestManager:
         return self.zone_quests.get(zone_name, [])
 
     def generate_quest(self, zone: str) -> Quest:
-        fish_list = [
-            f for f in ZONE_FISH_MAP.get(zone, [])
-            if f.get("rarity") not in ("???", "Exotic")
-        ]
-        if not fish_list:
-            return Quest(1, zone, target_fish="Carp", amount=1, reward=10)
-        quest_type = random.choice([1, 2])
-        amount = random.randint(1, 20)
-        if quest_type == 1:
-            fish = random.choice(fish_list)
-            rarity = fish["rarity"]
-            target_fish = fish["name"]
-        else:
-            rarity = random.choice(list({f["rarity"] for f in fish_list}))
-            target_fish = None
+        return self._bulk_generate(zone, 1)[0]
 
-        max_amount = 15
-        if rarity == "Legendary":
-            max_amount = 5
-        elif rarity == "Boss":
-            max_amount = 1
-        amount = min(amount, max_amount)
-
-        base_values = {
-            "Common": 10,
-            "Uncommon": 20,
-            "Rare": 100,
-            "Epic": 175,
-            "Mythical": 200,
-            "Legendary": 500,
-            "Boss": 10000,
-        }
-        reward = base_values.get(rarity, 0) * amount
-        if self.quest_boost_active:
-            adjusted_amount = max(1, math.ceil(amount * 0.7))
-        else:
-            adjusted_amount = amount
-        quest = Quest(
-            quest_type,
-            zone,
-            target_fish=target_fish,
-            rarity=rarity,
-            amount=adjusted_amount,
-            reward=reward,
-        )
-        self.original_amounts.setdefault(zone, []).append(amount)
-        return quest
+    def _bulk_generate(self, zone: str, n: int) -> List[Quest]:
+        """Roll ``n`` quests for a zone, drawing all random values up front."""
+        fish_list = ZONE_NONBOSS_FISH.get(zone, ())
+        if not fish_list:
+            return [Quest(1, zone, target_fish="Carp", amount=1, reward=10) for _ in range(n)]
+        quest_types = random.choices((1, 2), k=n)
+        amounts = random.choices(range(1, 21), k=n)
+        fishes = random.choices(fish_list, k=n)
+        rarities = random.choices(ZONE_RARITIES[zone], k=n)
+        originals = self.original_amounts.setdefault(zone, [])
+        quests = []
+        for quest_type, amount, fish, rarity in zip(quest_types, amounts, fishes, rarities):
+            if quest_type == 1:
+                rarity = fish["rarity"]
+                target_fish = fish["name"]
+            else:
+                target_fish = None
+
+            max_amount = 15
+            if rarity == "Legendary":
+                max_amount = 5
+            elif rarity == "Boss":
+                max_amount = 1
+            amount = min(amount, max_amount)
+
+            reward = QUEST_BASE_REWARD.get(rarity, 0) * amount
+            if self.quest_boost_active:
+                adjusted_amount = max(1, math.ceil(amount * 0.7))
+            else:
+                adjusted_amount = amount
+            quests.append(Quest(
+                quest_type,
+                zone,
+                target_fish=target_fish,
+                rarity=rarity,
+                amount=adjusted_amount,
+                reward=reward,
+            ))
+            originals.append(amount)
+        return quests
 
     def apply_quest_boost(self):
         self.quest_boost_active = True
@@ -898,7 +1195,7 @@ class QuestManager:
         if quest_index < 0 or quest_index >= len(quests):
             return 0
         quest = quests[quest_index]
-        if not quest.is_completed():
+        if quest.progress < quest.amount:
             return 0
         reward = quest.reward
         new_quest = self.generate_quest(zone)
@@ -948,58 +1245,71 @@ class QuestManager:
 # --------------------------- Game Class ---------------------------
 
 class Game:
+    # Immutable defaults live on the class; load_game() shadows them per
+    # instance with whatever the save file holds.
+    balance = 100
+    has_submarine = False
+    has_boat = False
+    has_torch = False
+    has_abyss_trench_access = False
+    has_ancient_sea_access = False
+    has_ancient_key = False
+    has_floating_key = False
+    current_hour = 0
+    current_day = 0
+    floating_island_day = 0
+    floating_island_today = False
+    floating_island_visible = False
+    event = "Nothing"
+    level = 0
+    xp = 0
+    streak = 0
+    current_zone = "Lake"
+    current_fish_list: Sequence[Dict] = FISH_LAKE
+    current_zone_catch_length = 5
+    current_fish: Optional[Dict] = None
+    fast_fishing_price = 15  # base cost per extra fish
+    daily_event: Optional[str] = None
+    daily_event_day = 0
+    # [FISH_TRAP fields]
+    inventory_fish_traps = 0
+    # [SEASONALS]
+    bait_in_use = ""
+    # [ACHIEVEMENTS]
+    current_title = ""
+    # argv of the game to switch to once run() returns; see play()
+    handoff: Optional[List[str]] = None
+
     def __init__(self):
         self.save_file = os.path.join(os.getcwd(), 'save_data.json')
-        # default values
-        self.balance = 100
+        # mutable defaults must be per instance
         self.inventory: List[Dict] = []
-        self.has_submarine = False
-        self.has_boat = False
-        self.has_torch = False
-        self.has_abyss_trench_access = False
-        self.has_ancient_sea_access = False
-        self.has_ancient_key = False
-        self.has_floating_key = False
-        self.current_hour = 0
-        self.current_day = 0
-        self.floating_island_day = self.current_day
-        self.floating_island_today = False
-        self.floating_island_visible = False
-        self.event = "Nothing"
-        self.level = 0
-        self.xp = 0
-        self.streak = 0
         self.discovery: Dict[str, Dict] = {}
-        self.current_zone = "Lake"
-        self.current_fish_list = FISH_LAKE
-        self.current_zone_catch_length = 5
-        self.current_fish = None
-        self.fast_fishing_price = 15  # base cost per extra fish
         self.loaded_quests: Dict[str, List[Dict]] = {}
-        self.daily_event: Optional[str] = None
-        self.daily_event_day: int = self.current_day
-        # [FISH_TRAP fields]
-        self.inventory_fish_traps = 0
         self.baits = {"normal": 0, "advanced": 0, "expert": 0, "legend": 0}
         self.active_traps: List[Dict] = []
-        # [SEASONALS]
         self.seasonal_log: Dict[str, Dict] = {}
-        self.bait_in_use: str = ""
         # [RUN_SUMMARY] session fields
         self.reset_session_stats()
         # [ACHIEVEMENTS] lifetime progression fields
         self.achievements: Dict[str, Dict] = {}
         self.counters: Dict = default_counters()
-        self.current_title: str = ""
         self.title_inventory: List[str] = []
+        # set when state changed but was not written yet; see _flush
+        self._dirty = False
+        self._save_batch = False
         # load existing data if any
         self.load_game()
         self.quest_manager = QuestManager(self.loaded_quests)
         self.update_floating_island_state()
         self.roll_daily_event_if_needed()
+        self._flush()
 
     # -------------- Save & Load --------------
     def save_game(self):
+        if self._save_batch:
+            self._dirty = True
+            return
         data = {
             'balance': self.balance,
             'inventoryFish': self.inventory,
@@ -1034,18 +1344,47 @@ class Game:
             # [SEASONALS_SAVE]
             'seasonalLog': self.seasonal_log,
         }
-        data_to_sign = data.copy()
-        data['sig'] = compute_save_signature(data_to_sign)
-        with open(self.save_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Serialize once: the file holds the exact bytes that were signed,
+        # followed by their signature on the last line.
+        payload = _canonical_bytes(data)
+        with open(self.save_file, 'wb') as f:
+            f.write(payload + b'\n' + _save_hmac(payload).hex().encode('ascii') + b'\n')
+        self._dirty = False
+
+    def _flush(self):
+        """Write the save if a deferred change is pending."""
+        if self._dirty:
+            self.save_game()
+
+    @contextmanager
+    def batch_save(self):
+        """Collapse save_game() calls made inside the block into one write on exit."""
+        self._save_batch = True
+        try:
+            yield
+        finally:
+            self._save_batch = False
+            self._flush()
 
     def load_game(self):
         if os.path.exists(self.save_file):
-            with open(self.save_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            saved_sig = data.pop('sig', '')
-            computed_sig = compute_save_signature(data)
-            if saved_sig != computed_sig:
+            with open(self.save_file, 'rb') as f:
+                raw = f.read().rstrip()
+            if raw.endswith(b'}'):
+                # Older saves: one JSON object carrying its own 'sig' field,
+                # signed over either the current or the ASCII-escaped encoding.
+                data = _json_loads(raw)
+                saved_sig = data.pop('sig', '')
+                valid = saved_sig in (compute_save_signature(data), compute_legacy_save_signature(data))
+            else:
+                payload, _, saved_sig = raw.rpartition(b'\n')
+                try:
+                    tag = bytes.fromhex(saved_sig.decode('ascii'))
+                except ValueError:
+                    tag = b''
+                valid = hmac.compare_digest(_save_hmac(payload), tag)
+                data = _json_loads(payload) if valid else {}
+            if not valid:
                 print("⚠️ Save file appears to have been tampered with (bad signature).")
                 exit()
             self.balance = data.get('balance', 100)
@@ -1074,6 +1413,8 @@ class Game:
             self.inventory_fish_traps = data.get('inventoryFishTraps', 0)
             self.baits = data.get('baits', {"normal": 0, "advanced": 0, "expert": 0, "legend": 0})
             self.active_traps = data.get('activeTraps', [])
+            for trap in self.active_traps:
+                trap.setdefault('overdue_seconds', TRAP_OVERDUE_SECONDS)
             self.achievements = data.get('achievements', {})
             saved_counters = data.get('counters', {})
             self.counters = default_counters()
@@ -1105,7 +1446,7 @@ class Game:
                 self.daily_event = random.choice(candidates)
             else:
                 self.daily_event = None
-            self.save_game()
+            self._dirty = True
 
     def update_floating_island_state(self):
         prev_day = self.floating_island_day
@@ -1132,43 +1473,35 @@ class Game:
             or prev_today != self.floating_island_today
             or prev_visible != self.floating_island_visible
         ):
-            self.save_game()
+            self._dirty = True
 
     # -------------- Level & XP --------------
     def calculate_xp_for_level(self, level: int) -> int:
-        if level == 0:
-            return 100
-        return 100 + (level * 100)
+        return 100 * (level + 1)
 
     def check_level_up(self):
-        xp_needed = self.calculate_xp_for_level(self.level)
-        while self.xp >= xp_needed and self.level < 100:
-            self.xp -= xp_needed
-            self.level += 1
-            if self.level >= 100:
-                self.level = 100
-                self.xp = 0
-                print("Congratulations! You reached max level 100!")
-                return
-            else:
-                print(f"Congratulations! You leveled up to level {self.level}!")
-            xp_needed = self.calculate_xp_for_level(self.level)
-        if self.level >= 100:
+        # Level L needs 100 * (L + 1) XP, so reaching level L from 0 takes
+        # 50 * L * (L + 1) in total; invert that instead of stepping levels.
+        level = self.level
+        if level >= 100:
             self.xp = 0
+            return
+        total = 50 * level * (level + 1) + self.xp
+        new_level = (math.isqrt(4 * (total // 50) + 1) - 1) // 2
+        if new_level == level:
+            return
+        if new_level >= 100:
+            self.level = 100
+            self.xp = 0
+            print("Congratulations! You reached max level 100!")
+            return
+        self.level = new_level
+        self.xp = total - 50 * new_level * (new_level + 1)
+        print(f"Congratulations! You leveled up to level {new_level}!")
 
     # -------------- Rarity helpers --------------
     def get_rarity_color(self, rarity: str) -> str:
-        mapping = {
-            "Common": "DarkGray",
-            "Uncommon": "Green",
-            "Rare": "Magenta",
-            "Epic": "Cyan",
-            "Legendary": "Yellow",
-            "Mythical": "DarkYellow",
-            "Exotic": "Red",
-            "???": "Red",
-        }
-        return mapping.get(rarity, "White")
+        return RARITY_COLOR.get(rarity, "White")
 
     def get_xp_by_rarity(self, rarity: str) -> int:
         values = {
@@ -1185,52 +1518,33 @@ class Game:
     # -------------- Zone helpers --------------
     def get_unlocked_zones(self) -> List[str]:
         zones = ["Lake"]
-        if self.has_boat:
-            zones.append("Sea")
-        if self.has_submarine:
-            zones.append("Bathyal")
-        if self.has_torch:
-            zones.append("Mystic Spring")
-        if self.has_abyss_trench_access:
-            zones.append("Abyss Trench")
-        if self.has_ancient_sea_access:
-            zones.append("Ancient Sea")
+        zones += [zone for zone, attr in ZONE_UNLOCKS if getattr(self, attr)]
         if self.has_floating_key and self.floating_island_visible:
             zones.append("Floating Island")
         return zones
 
-    def get_fish_list_for_zone(self, zone: str) -> List[Dict]:
+    def get_fish_list_for_zone(self, zone: str) -> Sequence[Dict]:
         return ZONE_FISH_MAP.get(zone, FISH_LAKE)
 
     def get_speed(self) -> float:
-        speed = 0.1  # seconds
-        if self.current_zone in ("Sea", "Mystic Spring"):
-            speed = max(speed / 2, 0.01)
-        elif self.current_zone == "Bathyal":
-            speed = max(speed / 4, 0.01)
-        elif self.current_zone == "Abyss Trench":
-            speed = max(speed / 7, 0.01)
-        elif self.current_zone == "Ancient Sea":
-            speed = max(speed / 10, 0.01)
-        elif self.current_zone == "Floating Island":
-            speed = max(speed / 12, 0.005)
-        return speed
+        return ZONE_SPEED.get(self.current_zone, BASE_SPEED)
 
     # -------------- Discovery --------------
     def update_discovery(self, zone: str, fish_name: str, weight: float, value: float):
         zone_data = self.discovery.setdefault(zone, {})
-        entry = zone_data.setdefault(fish_name, {
-            'count': 0,
-            'maxWeight': 0,
-            'maxValue': 0,
-        })
+        entry = zone_data.get(fish_name)
+        if entry is None:
+            zone_data[fish_name] = {
+                'count': 1,
+                'maxWeight': weight if weight > 0 else 0,
+                'maxValue': value if value > 0 else 0,
+            }
+            return
         entry['count'] += 1
         if weight > entry['maxWeight']:
             entry['maxWeight'] = weight
         if value > entry['maxValue']:
             entry['maxValue'] = value
-        zone_data[fish_name] = entry
-        self.discovery[zone] = zone_data
 
     # [SEASONALS]
     def update_seasonal_log(self, name: str, weight: float):
@@ -1318,10 +1632,12 @@ class Game:
 
     # [ACHIEVEMENTS] mark zone completion
     def update_zone_completion(self, zone: str):
-        fish_list = [f['name'] for f in ZONE_FISH_MAP.get(zone, []) if f.get('rarity') != '???']
-        zone_data = self.discovery.get(zone, {})
-        if fish_list and all(name in zone_data for name in fish_list):
-            self.counters['zones_completed'][zone] = True
+        completed = self.counters['zones_completed']
+        if not completed.get(zone):
+            catchable = ZONE_CATCHABLE.get(zone, ())
+            zone_data = self.discovery.get(zone, {})
+            if catchable and all(f['name'] in zone_data for f in catchable):
+                completed[zone] = True
         self.check_achievements()
 
     # [RUN_SUMMARY] record sale value
@@ -1487,17 +1803,17 @@ class Game:
             target_end = target_start + zone_len - 1
             extended_start = max(0, target_start - margin)
             extended_end = min(len(bar) - 1, target_end + margin)
+            target_line = ' ' * target_start + '=' * zone_len + ' ' * (len(bar) - target_end - 1)
+            cursor = bytearray(bar, 'ascii')
+            clear_screen()
             with RawInput():
                 prev_i = -1
                 for i in range(len(bar)):
-                    clear_screen()
-                    before = bar[:i]
-                    after = bar[i + 1:]
-                    line = before + "|" + after
-                    target_line = ''.join('=' if target_start <= j <= target_end else ' ' for j in range(len(bar)))
-                    print("Boss battle!")
-                    print(line)
-                    print(target_line)
+                    if i:
+                        cursor[i - 1] = 45  # '-'
+                    cursor[i] = 124  # '|'
+                    sys.stdout.write(FRAME % ("Boss battle!", cursor.decode('ascii'), target_line))
+                    sys.stdout.flush()
                     time.sleep(speed)
                     if key_pressed():
                         ch = read_key()
@@ -1514,65 +1830,70 @@ class Game:
         return True
 
     # -------------- Fish generation --------------
-    def get_fish_by_weighted_random(self, fish_list: List[Dict], fast_mode: bool = False) -> Dict | None:
+    def current_sampler(self) -> tuple:
+        """Return the precomputed catch pools for the current zone and clock."""
+        exotic = self.daily_event in EXOTIC_EVENTS
+        key = (self.current_zone, self.get_time_of_day(), self.get_current_season(), exotic)
+        return ZONE_SAMPLER.get(key) or build_fish_sampler(self.current_fish_list, *key[1:])
+
+    def get_fish_by_weighted_random(self, fast_mode: bool = False, sampler: tuple | None = None) -> Dict | None:
+        zone = self.current_zone
+        daily_event = self.daily_event
+        streak = self.streak
         # Chance to encounter zone boss
         boss_chance = BASE_BOSS_CHANCE
         if not fast_mode:
-            boss_chance += self.streak * BOSS_BONUS_PER_STREAK
-            if self.daily_event == "Full Moon Night":
-                boss_chance += 0.10
-            boss_chance = min(boss_chance, BOSS_CHANCE_CAP)
-            bonus = boss_chance - BASE_BOSS_CHANCE
-            if bonus > 0:
-                print(f"Boss spawn chance boosted by {bonus*100:.1f}%")
-        if random.random() < boss_chance and self.current_zone in ZONE_BOSS_MAP:
-            boss = ZONE_BOSS_MAP[self.current_zone]
+            boss_chance = boss_spawn_chance(streak, daily_event == "Full Moon Night")
+            if boss_chance > BASE_BOSS_CHANCE:
+                print(f"Boss spawn chance boosted by {(boss_chance - BASE_BOSS_CHANCE)*100:.1f}%")
+        if random.random() < boss_chance and zone in ZONE_BOSS_MAP:
+            boss = ZONE_BOSS_MAP[zone]
             print(boss["warning"])
-            if self.current_zone == "Floating Island":
+            if zone == "Floating Island":
                 success = self.run_boss_minigame_rounds(rounds=6, zone_len=2, speed=0.015)
             else:
                 success = self.run_boss_minigame_rounds()
             if success:
                 weight = random.randint(1000, 10000)
-                boss_entry = next((f for f in fish_list if f["name"] == boss["name"]), {})
+                boss_entry = ZONE_BY_NAME[zone].get(boss["name"], {})
                 boss_xp = boss_entry.get("xp", 0)
                 boss_price = boss_entry.get("price", 1000)
                 xp_gain = boss_xp
-                if self.daily_event == "Double XP Day":
+                if daily_event == "Double XP Day":
                     xp_gain *= 2
                 caught = {
                     "name": boss["name"],
                     "rarity": "???",
                     "price": boss_price,
                     "weight": weight,
-                    "zone": self.current_zone,
+                    "zone": zone,
                 }
-                self.current_fish = caught.copy()
-                self.inventory.append(self.current_fish.copy())
+                self.current_fish = caught
+                self.inventory.append(caught)
                 self.xp += xp_gain
                 self.check_level_up()
-                if self.daily_event == "Treasure Hunt" and random.random() < 0.10:
+                if daily_event == "Treasure Hunt" and random.random() < 0.10:
                     bonus_money = random.randint(500, 2000)
                     self.balance += bonus_money
                     print(f"💰 Treasure Hunt! You found {bonus_money}$!")
-                color = self.get_rarity_color("???")
+                color = RARITY_COLOR["???"]
                 print("\n" + color_text(f">> You caught {boss['name']} [???] - {weight} kg!", color))
                 value = round(weight * boss_price, 2)
-                new_species = boss["name"] not in self.discovery.get(self.current_zone, {})
-                self.update_discovery(self.current_zone, boss["name"], weight, value)
-                self.quest_manager.update_quest_progress(self.current_zone, boss["name"], "???")
+                new_species = boss["name"] not in self.discovery.get(zone, {})
+                self.update_discovery(zone, boss["name"], weight, value)
+                self.quest_manager.update_quest_progress(zone, boss["name"], "???")
                 self.record_catch(caught, xp_gain, new_species=new_species, is_boss=True)
-                self.update_zone_completion(self.current_zone)
+                self.update_zone_completion(zone)
                 self.save_game()
                 input("Press Enter to continue...")
             else:
                 print("\n>> The boss escaped! <<")
                 input("Press Enter to continue...")
             return None
-        if self.current_zone in SEASONAL_FISH:
+        if zone in SEASONAL_FISH:
             # [SEASONALS]
             season_name = self.get_current_season()
-            pool = SEASONAL_FISH[self.current_zone].get(season_name, [])
+            pool = SEASONAL_FISH[zone].get(season_name, [])
             if pool:
                 chance = SEASONAL_BASE_CHANCE
                 if self.bait_in_use == 'expert':
@@ -1590,133 +1911,41 @@ class Game:
                     caught = random.choice(pool).copy()
                     caught['is_seasonal'] = True
                     return caught
-        time_of_day = self.get_time_of_day()
-        season = self.get_current_season()
-        filtered: List[Dict] = []
-        for fish in fish_list:
-            if fish.get('rarity') == '???':
-                continue
-            allowed_times = fish.get('time_of_day')
-            allowed_seasons = fish.get('seasons')
-            if allowed_times and time_of_day not in allowed_times:
-                continue
-            if allowed_seasons and season not in allowed_seasons:
-                continue
-            filtered.append(fish)
-        if not filtered:
-            filtered = fish_list
-        weights = {
-            'Common': 5,
-            'Uncommon': 3,
-            'Rare': 2,
-            'Epic': 1,
-            'Legendary': 1,
-            'Mythical': 1,
-            'Exotic': 1 if self.daily_event in ("Exotic Surge", "Full Moon Night") else 0,
-        }
-        rare_types = {'Rare', 'Epic', 'Legendary', 'Mythical'}
-        if self.daily_event in ("Exotic Surge", "Full Moon Night"):
-            rare_types.add('Exotic')
-        rare_weighted = []
-        common_weighted = []
-        for fish in filtered:
-            rarity = fish.get('rarity', 'Common')
-            weight = weights.get(rarity, 3)
-            if rarity in rare_types:
-                rare_weighted.extend([fish] * weight)
-            else:
-                common_weighted.extend([fish] * weight)
-        if not rare_weighted:
-            pool = common_weighted or filtered
-            return random.choice(pool)
-        total_weight = len(rare_weighted) + len(common_weighted)
-        base_chance = len(rare_weighted) / total_weight * 100
-        if self.daily_event == "Streak Madness":
-            bonus = min(self.streak * 5, 40)
+        if sampler is None:
+            sampler = self.current_sampler()
+        filtered, rare, rare_cum, common, common_cum = sampler
+        if not rare:
+            if not common:
+                return random.choice(filtered)
+            return random.choices(common, cum_weights=common_cum)[0]
+        rare_total = rare_cum[-1]
+        total_weight = rare_total + (common_cum[-1] if common_cum else 0)
+        base_chance = rare_total / total_weight * 100
+        if daily_event == "Streak Madness":
+            bonus = min(streak * 5, 40)
         else:
-            bonus = min(self.streak * 2, 20)
+            bonus = min(streak * 2, 20)
         chance = base_chance + bonus
         chance = min(chance, 100)
         if random.randint(1, 100) <= chance:
-            pool = rare_weighted
-        else:
-            pool = common_weighted
-        return random.choice(pool)
+            return random.choices(rare, cum_weights=rare_cum)[0]
+        return random.choices(common, cum_weights=common_cum)[0]
 
     def generate_weight(self, name: str, rarity: str) -> float:
-        if name == "Shark":
-            return random.randint(50, 1000)
-        if name == "Whale":
-            return random.randint(100, 10000)
-        if name == "Tuna":
-            return random.randint(10, 75)
-        if name == "Flying Fish":
-            return random.uniform(1, 3)
-        if name == "Swordfish":
-            return random.randint(100, 300)
-        if name == "Electric Eel":
-            return random.randint(10, 50)
-        if name == "Lionfish":
-            return random.uniform(2, 6)
-        if name == "Giant Blue Marlin":
-            return random.randint(300, 800)
-        if name == "Sunfish":
-            return random.randint(500, 1500)
-        if name == "Deep-sea Dragonfish":
-            return random.randint(5, 20)
-        if name == "Lanternfish":
-            return random.randint(5, 15)
-        if name == "Anglerfish":
-            return random.randint(10, 25)
-        if name == "Black Swallower":
-            return random.randint(2, 10)
-        if name == "Goblin Shark":
-            return random.randint(50, 100)
-        if name == "Angler Leviathan":
-            return random.randint(15, 100)
-        if name == "Giant Squid":
-            return random.randint(1000, 5000)
-        if name == "Ancient Key":
-            return random.randint(100, 500)
-        if name == "Mosasaurus" or name == "Dunkleosteus":
-            return random.randint(1000, 3000)
-        if name == "Megalodon":
-            return random.randint(10000, 50000)
-        if name == "Leedsichthys":
-            return random.randint(100000, 1000000)
-        if name == "Prism Trout":
-            return random.randint(20, 80)
-        if name == "Spirit Koi":
-            return random.randint(20, 150)
-        if name == "Phoenix Scale Carp":
-            return random.randint(100, 300)
+        spec = FISH_WEIGHT_RANGES.get(name)
+        if spec is not None:
+            lo, hi, whole = spec
+            return random.randint(lo, hi) if whole else random.uniform(lo, hi)
         # default by rarity
-        if rarity == "Common":
-            return random.uniform(0.5, 2.5)
-        if rarity == "Uncommon":
-            return random.uniform(1.0, 4.0)
-        if rarity == "Rare":
-            return random.uniform(2.0, 6.0)
-        if rarity == "Epic":
-            return random.uniform(3.0, 8.0)
-        if rarity == "Legendary":
-            return random.uniform(5.0, 12.0)
-        if rarity == "Mythical":
-            return random.uniform(8.0, 20.0)
-        return random.uniform(1.0, 3.0)
+        return random.uniform(*RARITY_WEIGHT_RANGES.get(rarity, (1.0, 3.0)))
 
     # -------------- Zone choosing --------------
     def choose_zone(self):
         clear_screen()
         print("Choose your fishing zone:")
-        print("1. Sea (Need Boat)")
-        print("2. Lake")
-        print("3. Bathyal (Need Submarine)")
-        print("4. Mystic Spring (Need Torch)")
-        print("5. Abyss Trench (Need Submarine Upgrade 01)")
-        print("6. Ancient Sea (Need Submarine Upgrade 02)")
-        print("7. Floating Island (Need Floating Key; 12–16h if visible)")
-        option_max = 7
+        for key, (zone, label, *_rest) in ZONE_MENU.items():
+            print(f"{key}. {zone}{label}")
+        option_max = len(ZONE_MENU)
         seasonal_choice = None
         current_season = self.get_current_season()  # [SEASONAL_ZONE]
         seasonal_zone = SEASONAL_ZONES.get(current_season)
@@ -1725,69 +1954,21 @@ class Game:
             seasonal_choice = str(option_max)
             print(f"{option_max}. {seasonal_zone['id']} (Seasonal Zone) — {seasonal_zone['desc']}")
         choice = input(f"Pick your choice (1-{option_max}): ")
-        if choice == "1":
-            if not self.has_boat:
-                print("You don't have a boat to access Sea zone.")
-                time.sleep(3)
-                return
-            self.current_zone = "Sea"
-            self.current_fish_list = FISH_SEA
-            self.current_zone_catch_length = 3
-            print("You chose Sea zone. Catch zone length set to 3.")
-        elif choice == "2":
-            self.current_zone = "Lake"
-            self.current_fish_list = FISH_LAKE
-            self.current_zone_catch_length = 5
-            print("You chose Lake zone. Catch zone length set to 5.")
-        elif choice == "3":
-            if not self.has_submarine:
-                print("You don't have a submarine to access Bathyal zone.")
-                time.sleep(3)
-                return
-            self.current_zone = "Bathyal"
-            self.current_fish_list = FISH_BATHYAL
-            self.current_zone_catch_length = 5
-            print("You chose Bathyal zone. Minigame speed x4 faster.")
-        elif choice == "4":
-            if not self.has_torch:
-                print("You don't have a Torch to access Mystic Spring.")
+        config = ZONE_MENU.get(choice)
+        if config is not None:
+            zone, _label, catch_length, gate, locked_msg, chosen_msg = config
+            if gate and not getattr(self, gate):
+                print(locked_msg)
                 time.sleep(3)
                 return
-            self.current_zone = "Mystic Spring"
-            self.current_fish_list = FISH_MYSTIC_SPRING
-            self.current_zone_catch_length = 5
-            print("You chose Mystic Spring. Minigame speed x2 faster.")
-        elif choice == "5":
-            if not self.has_abyss_trench_access:
-                print("You don't have Submarine Upgrade 01 to access Abyss Trench.")
-                time.sleep(3)
-                return
-            self.current_zone = "Abyss Trench"
-            self.current_fish_list = FISH_ABYSS_TRENCH
-            self.current_zone_catch_length = 4
-            print("You chose Abyss Trench. Minigame speed x7 faster.")
-        elif choice == "6":
-            if not self.has_ancient_sea_access:
-                print("You don't have access to Ancient Sea.")
-                time.sleep(3)
-                return
-            self.current_zone = "Ancient Sea"
-            self.current_fish_list = FISH_ANCIENT_SEA
-            self.current_zone_catch_length = 3
-            print("You chose Ancient Sea. Minigame speed x10 faster.")
-        elif choice == "7":
-            if not self.has_floating_key:
-                print("You need the FLOATING KEY.")
-                time.sleep(3)
-                return
-            if not self.floating_island_visible:
+            if zone == "Floating Island" and not self.floating_island_visible:
                 print("The Floating Island is not visible right now (12–16h only).")
                 time.sleep(3)
                 return
-            self.current_zone = "Floating Island"
-            self.current_fish_list = FISH_FLOATING_ISLAND
-            self.current_zone_catch_length = 2
-            print("You reached the Floating Island. Minigame is much harder!")
+            self.current_zone = zone
+            self.current_fish_list = ZONE_FISH_MAP[zone]
+            self.current_zone_catch_length = catch_length
+            print(chosen_msg)
         elif seasonal_choice and choice == seasonal_choice:  # [SEASONAL_ZONE]
             self.current_zone = seasonal_zone['id']
             self.current_fish_list = seasonal_zone['fish']
@@ -1807,11 +1988,7 @@ class Game:
 
     # -------------- Time & Events --------------
     def get_time_of_day(self) -> str:
-        if 6 <= self.current_hour < 18:
-            return "Day"
-        if 18 <= self.current_hour < 22:
-            return "Sunset"
-        return "Night"
+        return HOUR_TIME_OF_DAY.get(self.current_hour, "Night")
 
     def get_current_season(self) -> str:
         return SEASONS[(self.current_day // 7) % 4]
@@ -1858,7 +2035,7 @@ class Game:
                     desc = f"Catch {q.amount} {q.target_fish}"
                 else:
                     desc = f"Catch {q.amount} {q.rarity} Fish"
-                status = "Finished" if q.is_completed() else "Didn't Finish"
+                status = "Finished" if q.progress >= q.amount else "Didn't Finish"
                 print(f"{idx}. {desc} ({status})")
             print("0. Return to main menu")
             choice = input("Select a quest: ")
@@ -1886,7 +2063,7 @@ class Game:
             print("0. Return")
             choice = input("Choose: ")
             if choice == '4':
-                if q.is_completed():
+                if q.progress >= q.amount:
                     reward = self.quest_manager.finish_quest(self.current_zone, quest_index)
                     self.balance += reward
                     self.counters['quests_completed'] += 1
@@ -1904,7 +2081,7 @@ class Game:
     # -------------- Menu --------------
     def show_menu(self):
         clear_screen()
-        xp_needed = self.calculate_xp_for_level(self.level)
+        xp_needed = 100 * (self.level + 1)
         if self.level >= 100:
             xp_percent = 100
         else:
@@ -1977,8 +2154,8 @@ class Game:
                     print("2) Go to casino")
                     choice = input("Choose: ").strip()
                     if choice == "2":
-                        subprocess.Popen([sys.executable, "casino.py", "--autoclaim", code, "--user", user_id])
-                        sys.exit(0)
+                        self.handoff = ["casino.py", "--autoclaim", code, "--user", user_id]
+                        return
                     if choice == "1":
                         return
                     print("Invalid choice.")
@@ -2029,10 +2206,7 @@ class Game:
                         self.streak = 0
                         input("Press Enter to continue...")
                     break
-                fish_list = list(self.current_fish_list)
-                if self.daily_event in ("Exotic Surge", "Full Moon Night"):
-                    fish_list += EXOTIC_FISH_FULL_MOON
-                selected = self.get_fish_by_weighted_random(fish_list)
+                selected = self.get_fish_by_weighted_random()
                 if not selected:
                     break
                 in_seasonal = any(
@@ -2080,62 +2254,56 @@ class Game:
             input("Press Enter to return to menu")
             return
         self.balance -= cost
-        fish_list = list(self.current_fish_list)
-        if self.daily_event in ("Exotic Surge", "Full Moon Night"):
-            fish_list += EXOTIC_FISH_FULL_MOON
         caught = []
         total_xp = 0
-        for i in range(amount):
-            if i > 0 and random.random() < 0.3:
-                print("Autofish failed! The fish escaped.")
-                continue
-            fish = self.get_fish_by_weighted_random(fish_list, fast_mode=True)
-            if not fish:
-                continue
-            fish = fish.copy()
-            weight_val = self.generate_weight(fish['name'], fish['rarity'])
-            fish['weight'] = round(weight_val, 1)
-            if self.current_zone == "Sea":
-                price_multiplier = SEA_PRICE_MULTIPLIER.get(fish['rarity'], 1)
-                price = round(fish.get('base_price', fish.get('price', 0)) * price_multiplier, 2)
-            elif self.current_zone == "Bathyal":
-                price = fish.get('base_price', fish.get('price', 0))
-            else:
-                price = fish.get('price', 0)
-            fish['price'] = price
-            entry = {
-                'name': fish['name'],
-                'rarity': fish['rarity'],
-                'price': fish['price'],
-                'weight': fish['weight'],
-                'zone': self.current_zone,
-                'is_seasonal': fish.get('is_seasonal', False),
-            }
-            self.inventory.append(entry.copy())
-            xp_gain = self.get_xp_by_rarity(fish['rarity'])
-            if self.daily_event == "Double XP Day":
-                xp_gain *= 2
-            self.xp += xp_gain
-            total_xp += xp_gain
-            self.check_level_up()
-            if self.daily_event == "Treasure Hunt" and random.random() < 0.10:
-                bonus_money = random.randint(500, 2000)
-                self.balance += bonus_money
-                print(f"💰 Treasure Hunt! You found {bonus_money}$!")
-            value = round(fish['weight'] * fish['price'], 2)
-            new_species = fish['name'] not in self.discovery.get(self.current_zone, {})
-            self.update_discovery(self.current_zone, fish['name'], fish['weight'], value)
-            self.quest_manager.update_quest_progress(self.current_zone, fish['name'], fish['rarity'])
-            self.record_catch(entry, xp_gain, new_species=new_species)
-            if entry['is_seasonal']:
-                self.update_seasonal_log(entry['name'], entry['weight'])
-            self.update_zone_completion(self.current_zone)
-            caught.append(entry)
-        self.fast_fishing_price = round(self.fast_fishing_price * 1.005, 4)
-        self.save_game()
+        with self.batch_save():
+            # zone, clock and event stay put for the whole batch
+            sampler = self.current_sampler()
+            zone = self.current_zone
+            daily_event = self.daily_event
+            rand = random.random
+            for i in range(amount):
+                if i > 0 and rand() < 0.3:
+                    print("Autofish failed! The fish escaped.")
+                    continue
+                fish = self.get_fish_by_weighted_random(fast_mode=True, sampler=sampler)
+                if not fish:
+                    continue
+                weight = round(self.generate_weight(fish['name'], fish['rarity']), 1)
+                price = PRICE_FN.get(zone, _default_price)(fish)
+                entry = {
+                    'name': fish['name'],
+                    'rarity': fish['rarity'],
+                    'price': price,
+                    'weight': weight,
+                    'zone': zone,
+                    'is_seasonal': fish.get('is_seasonal', False),
+                }
+                self.inventory.append(entry)
+                xp_gain = self.get_xp_by_rarity(fish['rarity'])
+                if daily_event == "Double XP Day":
+                    xp_gain *= 2
+                self.xp += xp_gain
+                total_xp += xp_gain
+                self.check_level_up()
+                if daily_event == "Treasure Hunt" and rand() < 0.10:
+                    bonus_money = random.randint(500, 2000)
+                    self.balance += bonus_money
+                    print(f"💰 Treasure Hunt! You found {bonus_money}$!")
+                value = round(weight * price, 2)
+                new_species = fish['name'] not in self.discovery.get(zone, {})
+                self.update_discovery(zone, fish['name'], weight, value)
+                self.quest_manager.update_quest_progress(zone, fish['name'], fish['rarity'])
+                self.record_catch(entry, xp_gain, new_species=new_species)
+                if entry['is_seasonal']:
+                    self.update_seasonal_log(entry['name'], entry['weight'])
+                self.update_zone_completion(zone)
+                caught.append(entry)
+            self.fast_fishing_price = round(self.fast_fishing_price * 1.005, 4)
+            self.save_game()
         print("\nFast fishing results:")
         for f in caught:
-            color = self.get_rarity_color(f['rarity'])
+            color = RARITY_COLOR.get(f['rarity'], 'White')
             print(color_text(f"- {f['name']} [{f['rarity']}] - {f['weight']} kg", color))
         print(f"Total XP gained: {total_xp}")
         print(f"Money spent: {cost}$")
@@ -2170,27 +2338,18 @@ class Game:
         zone_end = zone_start + zone_length - 1
         extended_start = max(0, zone_start - margin)
         extended_end = min(len(bar) - 1, zone_end + margin)
+        target_line = ' ' * zone_start + '=' * zone_length + ' ' * (len(bar) - zone_end - 1)
+        cursor = bytearray(bar, 'ascii')
+        clear_screen()
         with RawInput():
             i = 0
             while i < len(bar):
-                clear_screen()
-                before = bar[:i]
-                after = bar[i+1:]
-                line = before + "|" + after
-                target_line = ''.join('=' if zone_start <= j <= zone_end else ' ' for j in range(len(bar)))
-                print("Catch zone:")
-                print(line)
-                print(target_line)
-                start_time = time.time()
-                key = None
-                while time.time() - start_time < speed:
-                    if key_pressed():
-                        key = read_key()
-                        break
-                    time.sleep(0.001)
-                # Handle key presses that occur exactly as the timer ends
-                if key is None and key_pressed():
-                    key = read_key()
+                if i:
+                    cursor[i - 1] = 45  # '-'
+                cursor[i] = 124  # '|'
+                sys.stdout.write(FRAME % ("Catch zone:", cursor.decode('ascii'), target_line))
+                sys.stdout.flush()
+                key = wait_key(speed)
                 if key == ' ' or key in ENTER_KEYS:
                     pos = i
                     if extended_start <= pos <= extended_end:
@@ -2204,42 +2363,31 @@ class Game:
         return False
 
     def obtain_fish(self, fish: Optional[Dict] = None, full_moon_event=False):
+        # the picked record is shared with the fish tables, so the rolled
+        # weight and price stay in locals instead of a mutated copy
         if full_moon_event:
-            fish = random.choice(EXOTIC_FISH_FULL_MOON).copy()
-            fish['weight'] = random.randint(1000, 100000)
+            fish = random.choice(EXOTIC_FISH_FULL_MOON)
+            weight = random.randint(1000, 100000)
             price = fish['price']
         else:
             if fish is None:
-                fish_list = list(self.current_fish_list)
-                if self.daily_event in ("Exotic Surge", "Full Moon Night"):
-                    fish_list += EXOTIC_FISH_FULL_MOON
-                fish = self.get_fish_by_weighted_random(fish_list)
+                fish = self.get_fish_by_weighted_random()
                 if fish is None:
                     if self.streak > 0:
                         print("The fish run and you lost the streak")
                     self.streak = 0
                     return
-            fish = fish.copy()
-            weight = self.generate_weight(fish['name'], fish['rarity'])
-            fish['weight'] = round(weight, 1)
-            if self.current_zone == "Sea":
-                price_multiplier = SEA_PRICE_MULTIPLIER.get(fish['rarity'], 1)
-                price = round(fish.get('base_price', fish.get('price', 0)) * price_multiplier, 2)
-            elif self.current_zone == "Bathyal":
-                price = fish.get('base_price', fish.get('price', 0))
-            else:
-                price = fish.get('price', 0)
-            fish['price'] = price
-        weight = round(fish['weight'], 1)
+            weight = round(self.generate_weight(fish['name'], fish['rarity']), 1)
+            price = PRICE_FN.get(self.current_zone, _default_price)(fish)
         self.current_fish = {
             'name': fish['name'],
             'rarity': fish['rarity'],
-            'price': fish['price'],
+            'price': price,
             'weight': weight,
             'zone': self.current_zone,
             'is_seasonal': fish.get('is_seasonal', False),
         }
-        self.inventory.append(self.current_fish.copy())
+        self.inventory.append(self.current_fish)
         xp_gain = self.get_xp_by_rarity(fish['rarity'])
         if self.daily_event == "Double XP Day":
             xp_gain *= 2
@@ -2249,9 +2397,9 @@ class Game:
             bonus_money = random.randint(500, 2000)
             self.balance += bonus_money
             print(f"💰 Treasure Hunt! You found {bonus_money}$!")
-        color = 'Red' if fish['rarity'] == 'Exotic' else self.get_rarity_color(fish['rarity'])
+        color = RARITY_COLOR.get(fish['rarity'], 'White')
         print("\n" + color_text(f">> You caught a {fish['name']} [{fish['rarity']}] - {weight} kg.", color))
-        value = round(weight * fish['price'], 2)
+        value = round(weight * price, 2)
         new_species = fish['name'] not in self.discovery.get(self.current_zone, {})
         self.update_discovery(self.current_zone, fish['name'], weight, value)
         self.quest_manager.update_quest_progress(self.current_zone, fish['name'], fish['rarity'])
@@ -2270,7 +2418,8 @@ class Game:
             print("🔑 You found a mysterious FLOATING KEY hidden inside the fish!")
             print("☁️ Now you can access the Floating Island when it appears!")
             self.update_floating_island_state()
-        self.save_game()
+        # written by the main loop together with the clock advance that follows
+        self._dirty = True
         input("Press Enter to continue...")
 
     # -------------- Inventory / Selling --------------
@@ -2281,12 +2430,13 @@ class Game:
             input("Press Enter to return to menu")
             return
         print("Fish in inventory:")
-        for idx, f in enumerate(self.inventory, 1):
-            color = self.get_rarity_color(f['rarity'])
-            print(color_text(f"{idx}. {f['name']} [{f['rarity']}] - {f['weight']} kg", color))
+        print("\n".join(
+            color_text(f"{idx}. {f['name']} [{f['rarity']}] - {f['weight']} kg", RARITY_COLOR.get(f['rarity'], 'White'))
+            for idx, f in enumerate(self.inventory, 1)
+        ))
         option = input("\nType 'all' to sell everything, or 'sell x Name' (e.g., sell x2 Carp): ")
         if option == 'all':
-            total = sum(f['weight'] * f['price'] for f in self.inventory)
+            total = math.fsum(f['weight'] * f['price'] for f in self.inventory)
             fish_count = len(self.inventory)
             jackpot = False
             if self.daily_event == "Jackpot Sell" and random.random() < 0.05:
@@ -2311,20 +2461,22 @@ class Game:
             try:
                 parts = option.split()
                 amount = int(parts[1][1:])  # after 'x'
+                if amount < 1:
+                    raise ValueError(amount)
                 name = ' '.join(parts[2:])
             except Exception:
                 print("\nInvalid input.")
                 input("Press Enter to return to menu")
                 return
-            found = [f for f in self.inventory if f['name'] == name]
+            inventory = self.inventory
+            # stop scanning once enough matches are found
+            found = list(islice((i for i, f in enumerate(inventory) if f['name'] == name), amount))
             if len(found) < amount:
                 print(f"\nYou don't have enough '{name}' to sell.")
             else:
-                sell_list = found[:amount]
-                sell_value = 0
-                for fish in sell_list:
-                    sell_value += fish['weight'] * fish['price']
-                    self.inventory.remove(fish)
+                sell_value = math.fsum(inventory[i]['weight'] * inventory[i]['price'] for i in found)
+                sold = set(found)
+                self.inventory = [f for i, f in enumerate(inventory) if i not in sold]
                 jackpot = False
                 if self.daily_event == "Jackpot Sell" and random.random() < 0.05:
                     sell_value *= 3
@@ -2351,52 +2503,45 @@ class Game:
             print("Your fish inventory is empty.")
         else:
             print("Your Fish Inventory:")
-            for idx, fish in enumerate(self.inventory, 1):
-                color = self.get_rarity_color(fish['rarity'])
-                print(color_text(f"{idx}. {fish['name']} [{fish['rarity']}] - {round(fish['weight'],1)} kg", color))
+            print("\n".join(
+                color_text(f"{idx}. {fish['name']} [{fish['rarity']}] - {round(fish['weight'],1)} kg",
+                           RARITY_COLOR.get(fish['rarity'], 'White'))
+                for idx, fish in enumerate(self.inventory, 1)
+            ))
         input("Press Enter to return to menu")
 
     # -------------- Discovery Book --------------
     def show_discovery_book(self):
         clear_screen()
         print("Discovery Book:")
-        print("1. Lake")
-        print("2. Sea")
-        print("3. Bathyal")
-        print("4. Mystic Spring")
-        print("5. Abyss Trench")
-        print("6. Ancient Sea")
-        print("7. Floating Island")
-        choice = input("Pick a zone (1-7): ")
-        mapping = {
-            "1": ("Lake", FISH_LAKE),
-            "2": ("Sea", FISH_SEA),
-            "3": ("Bathyal", FISH_BATHYAL),
-            "4": ("Mystic Spring", FISH_MYSTIC_SPRING),
-            "5": ("Abyss Trench", FISH_ABYSS_TRENCH),
-            "6": ("Ancient Sea", FISH_ANCIENT_SEA),
-            "7": ("Floating Island", FISH_FLOATING_ISLAND),
-        }
-        if choice not in mapping:
+        options = {str(idx): zone for idx, zone in enumerate(ZONE_FISH_MAP, 1)}
+        for key, zone in options.items():
+            print(f"{key}. {zone}")
+        choice = input(f"Pick a zone (1-{len(options)}): ")
+        zone = options.get(choice)
+        if zone is None:
             return
-        zone, fish_list = mapping[choice]
+        fish_list = ZONE_FISH_MAP[zone]
         clear_screen()
         zone_data = self.discovery.get(zone, {})
+        # one pass over the zone table counts discoveries and builds the rows
+        rows = []
+        found = 0
+        for f in fish_list:
+            entry = zone_data.get(f['name'])
+            if entry is None:
+                rows.append("??? [--] - Times: -- - Heaviest: -- kg - Max Value: --")
+                continue
+            found += 1
+            value = round(entry['maxValue'], 2)
+            rows.append(color_text(
+                f"{f['name']} [{f['rarity']}] - Times: {entry['count']} - Heaviest: {entry['maxWeight']} kg - Max Value: {value}$",
+                RARITY_COLOR.get(f['rarity'], 'White')))
         total = len(fish_list)
-        found = sum(1 for f in fish_list if f['name'] in zone_data)
         percent = round((found / total) * 100, 0) if total else 0
         print(f"→ You have discovered {found}/{total} fish ({percent}%)")
         print()
-        for f in fish_list:
-            if f['name'] in zone_data:
-                entry = zone_data[f['name']]
-                color = self.get_rarity_color(f['rarity'])
-                value = round(entry['maxValue'], 2)
-                print(color_text(
-                    f"{f['name']} [{f['rarity']}] - Times: {entry['count']} - Heaviest: {entry['maxWeight']} kg - Max Value: {value}$",
-                    color))
-            else:
-                print("??? [--] - Times: -- - Heaviest: -- kg - Max Value: --")
+        print("\n".join(rows))
         input("Press Enter to return to menu")
 
     # -------------- Shop --------------
@@ -2473,8 +2618,7 @@ class Game:
             choice = input("Choose item: ")
             if choice == '0':
                 return
-            mapping = {'1': 'trap', '2': 'normal', '3': 'advanced', '4': 'expert', '5': 'legend'}
-            if choice not in mapping:
+            if choice not in BAIT_SHOP_MAP:
                 print("Invalid choice.")
                 time.sleep(2)
                 continue
@@ -2484,7 +2628,7 @@ class Game:
                 time.sleep(2)
                 continue
             qty = int(qty)
-            item = mapping[choice]
+            item = BAIT_SHOP_MAP[choice]
             cost = BAIT_PRICES[item] * qty
             if self.balance < cost:
                 print("Not enough balance.")
@@ -2555,17 +2699,11 @@ class Game:
                 print("Invalid choice.")
                 time.sleep(1)
         available = [b for b, c in self.baits.items() if c > 0]
-        bait_names = {
-            'normal': 'Normal Bait',
-            'advanced': 'Advanced Bait',
-            'expert': 'Expert Bait',
-            'legend': 'Legend Bait',
-        }
         while True:
             clear_screen()
             print("Choose bait:")
             for idx, b in enumerate(available, 1):
-                print(f"{idx}. {bait_names[b]} (Stock: {self.baits[b]})")
+                print(f"{idx}. {BAIT_NAMES[b]} (Stock: {self.baits[b]})")
             print("0. Cancel")
             choice = input("Bait: ")
             if choice == '0':
@@ -2589,7 +2727,7 @@ class Game:
         }
         self.add_active_trap(trap)
         self.save_game()
-        print(f"Fish Trap set in {zone} using {bait_names[bait]}.")
+        print(f"Fish Trap set in {zone} using {BAIT_NAMES[bait]}.")
         time.sleep(2)
 
     def check_fish_trap_menu(self):
@@ -2597,19 +2735,14 @@ class Game:
             print("No active traps.")
             time.sleep(2)
             return
-        bait_names = {
-            'normal': 'Normal Bait',
-            'advanced': 'Advanced Bait',
-            'expert': 'Expert Bait',
-            'legend': 'Legend Bait',
-        }
         while True:
             clear_screen()
             print("Active Fish Traps:")
+            now = time.time()
             for idx, trap in enumerate(self.active_traps, 1):
-                elapsed = time.time() - trap['real_start_ts']
+                elapsed = now - trap['real_start_ts']
                 duration = trap['duration_seconds']
-                overdue = trap.get('overdue_seconds', TRAP_OVERDUE_SECONDS)
+                overdue = trap['overdue_seconds']
                 if elapsed >= duration:
                     status = 'READY'
                     if elapsed >= duration + overdue:
@@ -2627,7 +2760,7 @@ class Game:
             trap = self.active_traps[idx]
             elapsed = time.time() - trap['real_start_ts']
             duration = trap['duration_seconds']
-            overdue = trap.get('overdue_seconds', TRAP_OVERDUE_SECONDS)
+            overdue = trap['overdue_seconds']
             if elapsed >= duration + overdue:
                 print("The trap was overdue and broke.")
                 self.remove_active_trap(idx)
@@ -2635,9 +2768,10 @@ class Game:
                 time.sleep(2)
                 continue
             if elapsed >= duration:
-                results, _ = self.resolve_trap(trap)
-                self.remove_active_trap(idx)
-                self.save_game()
+                with self.batch_save():
+                    results, _ = self.resolve_trap(trap)
+                    self.remove_active_trap(idx)
+                    self.save_game()
                 print(f"You collected {len(results)} fish!")
                 time.sleep(2)
                 continue
@@ -2645,22 +2779,26 @@ class Game:
             clear_screen()
             print(f"Fish caught: {trap['caught_count']}/{trap['capacity_max']}")
             print(f"Remaining time: {format_remaining_time(remaining)}")
-            print("Bait: " + bait_names.get(trap['bait'], ''))
+            print("Bait: " + BAIT_NAMES.get(trap['bait'], ''))
             input("Press Enter to return...")
 
     def resolve_trap(self, trap: Dict):
         zone = trap['zone']
         bait = trap['bait']
-        fish_list = self.get_fish_list_for_zone(zone)
+        table = zone if zone in ZONE_FISH_MAP else "Lake"
+        pool = TRAP_POOLS.get((table, bait), ZONE_CATCHABLE[table])
+        boss_entry = ZONE_BOSS_FISH[table]
         results = []
         total_xp = 0
         count = random.randint(3, 7)
+        rand = random.random
+        choice = random.choice
+        randint = random.randint
         for _ in range(count):
             if bait == 'legend':
-                if random.random() < 0.4:
-                    boss_entry = next((f for f in fish_list if f['rarity'] == '???'), None)
+                if rand() < 0.4:
                     if boss_entry:
-                        weight = random.randint(1000, 10000)
+                        weight = randint(1000, 10000)
                         price = boss_entry.get('price', boss_entry.get('base_price', 0))
                         entry = {
                             'name': boss_entry['name'],
@@ -2669,7 +2807,7 @@ class Game:
                             'weight': weight,
                             'zone': zone,
                         }
-                        self.inventory.append(entry.copy())
+                        self.inventory.append(entry)
                         value = round(weight * price, 2)
                         new_species = entry['name'] not in self.discovery.get(zone, {})
                         self.update_discovery(zone, entry['name'], weight, value)
@@ -2683,39 +2821,20 @@ class Game:
                         self.update_zone_completion(zone)
                         results.append(entry)
                         continue
-                filtered = [f for f in fish_list if f['rarity'] == 'Exotic']
-                if not filtered:
-                    filtered = [f for f in fish_list if f['rarity'] != '???']
-                fish = random.choice(filtered).copy()
-            else:
-                filtered = [
-                    f for f in fish_list
-                    if f['rarity'] in BAIT_RARITY_MAP.get(bait, []) and f['rarity'] != '???'
-                ]
-                if not filtered:
-                    filtered = [f for f in fish_list if f['rarity'] != '???']
-                fish = random.choice(filtered).copy()
-            weight_val = self.generate_weight(fish['name'], fish['rarity'])
-            fish['weight'] = round(weight_val, 1)
-            if zone == 'Sea':
-                price_multiplier = SEA_PRICE_MULTIPLIER.get(fish['rarity'], 1)
-                price = round(fish.get('base_price', fish.get('price', 0)) * price_multiplier, 2)
-            elif zone == 'Bathyal':
-                price = fish.get('base_price', fish.get('price', 0))
-            else:
-                price = fish.get('price', 0)
-            fish['price'] = price
+            fish = choice(pool)
+            weight = round(self.generate_weight(fish['name'], fish['rarity']), 1)
+            price = PRICE_FN.get(zone, _default_price)(fish)
             entry = {
                 'name': fish['name'],
                 'rarity': fish['rarity'],
                 'price': price,
-                'weight': fish['weight'],
+                'weight': weight,
                 'zone': zone,
             }
-            self.inventory.append(entry.copy())
-            value = round(fish['weight'] * price, 2)
+            self.inventory.append(entry)
+            value = round(weight * price, 2)
             new_species = fish['name'] not in self.discovery.get(zone, {})
-            self.update_discovery(zone, fish['name'], fish['weight'], value)
+            self.update_discovery(zone, fish['name'], weight, value)
             xp_gain = self.get_xp_by_rarity(fish['rarity'])
             if self.daily_event == 'Double XP Day':
                 xp_gain *= 2
@@ -2730,51 +2849,71 @@ class Game:
 
     # -------------- Main loop --------------
     def run(self):
-        while True:
-            self.show_menu()
-            choice = input("Pick your choice (1-12): ")
-            if choice == '1':
-                self.start_fishing()
-                self.advance_time()
-            elif choice == '2':
-                self.fast_fishing()
-                self.advance_time()
-            elif choice == '3':
-                self.choose_zone()
-            elif choice == '4':
-                self.sell_fish()
-            elif choice == '5':
-                self.show_inventory()
-            elif choice == '6':
-                self.show_shop()
-            elif choice == '7':
-                self.show_discovery_book()
-            elif choice == '8':
-                self.show_quest_menu()
-            elif choice == '9':
-                self.show_run_summary()
-                break
-            elif choice == '10':
-                self.bait_trap_shop_menu()
-            elif choice == '11':
-                self.fish_trap_menu()
-            elif choice == '12':
-                self.show_achievements_menu()
-            elif choice == '13':
-                self.bank_menu()
-            elif choice == 'admin':
-                self.balance += 1000000000
-                print("🛠️ Admin mode activated! You received 1,000,000,000$")
-                self.save_game()
-                time.sleep(2)
-            else:
-                print("Invalid choice.")
-                time.sleep(1)
+        try:
+            while True:
+                self._flush()
+                self.show_menu()
+                choice = input("Pick your choice (1-12): ")
+                if choice == '1':
+                    self.start_fishing()
+                    self.advance_time()
+                elif choice == '2':
+                    self.fast_fishing()
+                    self.advance_time()
+                elif choice == '3':
+                    self.choose_zone()
+                elif choice == '4':
+                    self.sell_fish()
+                elif choice == '5':
+                    self.show_inventory()
+                elif choice == '6':
+                    self.show_shop()
+                elif choice == '7':
+                    self.show_discovery_book()
+                elif choice == '8':
+                    self.show_quest_menu()
+                elif choice == '9':
+                    self.show_run_summary()
+                    break
+                elif choice == '10':
+                    self.bait_trap_shop_menu()
+                elif choice == '11':
+                    self.fish_trap_menu()
+                elif choice == '12':
+                    self.show_achievements_menu()
+                elif choice == '13':
+                    self.bank_menu()
+                    if self.handoff:
+                        break
+                elif choice == 'admin':
+                    self.balance += 1000000000
+                    print("🛠️ Admin mode activated! You received 1,000,000,000$")
+                    self.save_game()
+                    time.sleep(2)
+                else:
+                    print("Invalid choice.")
+                    time.sleep(1)
+        finally:
+            self._flush()
 
 # --------------------------- Main entry ---------------------------
 
-def main():
+def export_save(path: str) -> None:
+    """Print a save file as indented JSON for inspection; saves are stored compact."""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read().rstrip()
+    except FileNotFoundError:
+        sys.exit(f"No save file to export at {path}.")
+    payload = raw if raw.endswith(b'}') else raw.rpartition(b'\n')[0]
+    print(json.dumps(_json_loads(payload), indent=2, ensure_ascii=False))
+
+def main() -> Optional[List[str]]:
+    """Run the fishing game; returns the argv of the game to switch to, if any."""
     args = sys.argv[1:]
+    if "--export-save" in args:
+        export_save(os.path.join(os.getcwd(), 'save_data.json'))
+        return
     autoclaim_code = None
     autoclaim_user = None
     i = 0
@@ -2801,6 +2940,19 @@ def main():
             print(f"Auto-received ${amount} from {from_app}.")
 
     game.run()
+    return game.handoff
+
+def play(argv: List[str]) -> None:
+    """Run whichever game argv names, following handoffs between them until one exits.
+
+    Each main() returns before the next one starts, so moving back and forth
+    never nests calls or keeps a finished game's state alive.
+    """
+    import casino
+    games = {"fishing.py": main, "casino.py": casino.main}
+    while argv:
+        sys.argv = argv
+        argv = games[argv[0]]()
 
 if __name__ == '__main__':
-    main()
+    play(["fishing.py", *sys.argv[1:]])